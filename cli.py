@@ -24,7 +24,8 @@ import hashlib
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import SEO audit modules
-from src.main import app
+from src.main import app, configure_nltk_data_path
+configure_nltk_data_path()
 from src.models.seo_data import db, Website, Page, Keyword, Link, TechnicalSEO
 from src.crawler.seo_crawler import SEOCrawler
 from src.crawler.data_importer import SEODataImporter
@@ -292,7 +293,7 @@ class SEOAuditCLI:
                 # Create temporary file for crawl result
                 temp_file = f"/tmp/crawl_result_{url_hash}.json"
                 with open(temp_file, 'w', encoding='utf-8') as f:
-                    json.dump(crawl_result, f, ensure_ascii=False, indent=2)
+                    json.dump(crawl_result, f, ensure_ascii=False)
                 
                 import_summary = importer.import_from_json(temp_file)
                 self._print_success("Data imported successfully")
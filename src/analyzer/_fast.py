@@ -0,0 +1,64 @@
+import numpy as np
+
+# Numba JIT 컴파일 (설치되지 않은 경우 NumPy 구현으로 대체)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def keyword_stats(token_ids, vocab_size):
+        """
+        토큰 ID 배열에서 어휘별 출현 횟수 계산
+
+        Args:
+            token_ids (ndarray): int64 토큰 ID 배열
+            vocab_size (int): 어휘 크기
+
+        Returns:
+            ndarray: 어휘 ID별 출현 횟수
+        """
+        counts = np.zeros(vocab_size, np.int64)
+        for i in range(token_ids.size):
+            counts[token_ids[i]] += 1
+        return counts
+else:
+    def keyword_stats(token_ids, vocab_size):
+        """
+        토큰 ID 배열에서 어휘별 출현 횟수 계산
+
+        Args:
+            token_ids (ndarray): int64 토큰 ID 배열
+            vocab_size (int): 어휘 크기
+
+        Returns:
+            ndarray: 어휘 ID별 출현 횟수
+        """
+        return np.bincount(token_ids, minlength=vocab_size)
+
+
+def most_common_words(words, top_n=30):
+    """
+    단어 목록에서 출현 빈도 상위 단어 추출 (Counter.most_common과 같은 순서)
+
+    Args:
+        words (list): 단어 목록
+        top_n (int): 반환할 상위 단어 수
+
+    Returns:
+        list: (단어, 출현 횟수) 튜플 목록
+    """
+    if not words:
+        return []
+
+    # 처음 등장한 순서대로 정수 어휘 ID 부여
+    vocab = {}
+    token_ids = np.fromiter((vocab.setdefault(word, len(vocab)) for word in words), dtype=np.int64, count=len(words))
+    counts = keyword_stats(token_ids, len(vocab))
+
+    # 안정 정렬로 동률일 때 먼저 등장한 단어가 앞에 오도록 유지
+    order = np.argsort(-counts, kind='stable')[:top_n]
+    vocab_words = list(vocab)
+    return [(vocab_words[i], int(counts[i])) for i in order]
@@ -1,6 +1,7 @@
-import json
+import orjson
 import os
 import re
+from sqlalchemy.orm import selectinload
 from src.models.seo_data import db, Website, Page, Keyword, Link
 
 class OnPageSEOAnalyzer:
@@ -29,6 +30,10 @@ class OnPageSEOAnalyzer:
         """
         results = []
         
+        # 본문까지 한 번에 미리 로드해 페이지별 지연 로딩(N+1 쿼리)을 방지
+        # (세션 identity map이 약한 참조이므로 반복 동안 목록을 유지)
+        pages = Page.query.options(selectinload(Page.page_content)).filter(Page.id.in_(page_ids)).all()
+        
         for page_id in page_ids:
             page_result = self.analyze_page(page_id)
             if page_result:
@@ -46,7 +51,7 @@ class OnPageSEOAnalyzer:
         Returns:
             dict: 페이지 분석 결과
         """
-        page = Page.query.get(page_id)
+        page = Page.query.options(selectinload(Page.page_content)).get(page_id)
         if not page:
             return None
             
@@ -477,7 +482,7 @@ class OnPageSEOAnalyzer:
         Returns:
             str: 저장된 파일 경로
         """
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_NON_STR_KEYS))
             
         return output_file
@@ -1,7 +1,7 @@
-import json
+import orjson
 import os
 from collections import defaultdict
-from src.models.seo_data import db, Website, Page, Link
+from src.models.seo_data import db, Website, Page, PageContent, Link
 
 class PageRanker:
     """
@@ -84,6 +84,14 @@ class PageRanker:
                         .filter(Page.website_id == website_id, Link.is_internal == True) \
                         .all()
                         
+        # 콘텐츠 길이만 조회 (본문 TEXT 자체는 읽지 않음)
+        content_lengths = dict(
+            db.session.query(PageContent.page_id, db.func.length(PageContent.content))
+            .join(Page, PageContent.page_id == Page.id)
+            .filter(Page.website_id == website_id)
+            .all()
+        )
+                        
         # 페이지 URL을 ID로 매핑
         page_url_to_id = {page.url: page.id for page in pages}
         
@@ -133,12 +141,11 @@ class PageRanker:
                 score += 5
                 
             # 6. 콘텐츠 길이 가중치
-            if page.content:
-                content_length = len(page.content)
-                if content_length > 1000:
-                    score += 10
-                elif content_length > 500:
-                    score += 5
+            content_length = content_lengths.get(page.id) or 0
+            if content_length > 1000:
+                score += 10
+            elif content_length > 500:
+                score += 5
                     
             # 점수 저장
             page_scores[page.id] = score
@@ -158,7 +165,7 @@ class PageRanker:
         Returns:
             str: 저장된 파일 경로
         """
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(ranked_pages, f, ensure_ascii=False, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(ranked_pages, option=orjson.OPT_NON_STR_KEYS))
             
         return output_file
@@ -1,5 +1,5 @@
 import requests
-import json
+import orjson
 import re
 import urllib.parse
 import logging
@@ -82,7 +82,7 @@ class TechnicalSEOChecker:
         }
         
         # 기술적 SEO 정보 업데이트
-        tech_seo.core_web_vitals = json.dumps(results['core_web_vitals'])
+        tech_seo.core_web_vitals = orjson.dumps(results['core_web_vitals'], option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
         self.db.session.commit()
         
         self.logger.info(f"웹사이트 {website.url}의 기술적 SEO 요소 검사 완료")
@@ -598,8 +598,8 @@ class TechnicalSEOChecker:
         Returns:
             str: 저장된 파일 경로
         """
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_NON_STR_KEYS))
             
         self.logger.info(f"기술적 SEO 검사 결과가 {output_file}에 저장되었습니다.")
         return output_file
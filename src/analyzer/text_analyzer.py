@@ -1,12 +1,27 @@
 import nltk
 import networkx as nx
-import json
+import orjson
 import os
 import re
-from collections import Counter
+import functools
+from sqlalchemy.orm import selectinload
 from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
 from src.models.seo_data import db, Website, Page, Keyword, Link, TechnicalSEO
+from src.analyzer._fast import most_common_words
+
+@functools.cache
+def _ensure_nltk_resources():
+    """NLTK 데이터 확인 (프로세스당 한 번만 디스크 탐색)"""
+    try:
+        nltk.data.find('tokenizers/punkt')
+    except LookupError:
+        nltk.download('punkt')
+        
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        nltk.download('stopwords')
 
 class TextAnalyzer:
     """
@@ -25,15 +40,7 @@ class TextAnalyzer:
         
     def _ensure_nltk_data(self):
         """NLTK 데이터 다운로드 확인"""
-        try:
-            nltk.data.find('tokenizers/punkt')
-        except LookupError:
-            nltk.download('punkt')
-            
-        try:
-            nltk.data.find('corpora/stopwords')
-        except LookupError:
-            nltk.download('stopwords')
+        _ensure_nltk_resources()
     
     def analyze_website(self, website_id):
         """
@@ -49,7 +56,8 @@ class TextAnalyzer:
         if not website:
             raise ValueError(f"ID가 {website_id}인 웹사이트를 찾을 수 없습니다.")
             
-        pages = Page.query.filter_by(website_id=website_id).all()
+        # 본문을 함께 로드해 analyze_page의 페이지별 지연 로딩을 방지
+        pages = Page.query.options(selectinload(Page.page_content)).filter_by(website_id=website_id).all()
         
         results = {
             'website_url': website.url,
@@ -75,7 +83,7 @@ class TextAnalyzer:
         Returns:
             dict: 페이지 분석 결과
         """
-        page = Page.query.get(page_id)
+        page = Page.query.options(selectinload(Page.page_content)).get(page_id)
         if not page:
             raise ValueError(f"ID가 {page_id}인 페이지를 찾을 수 없습니다.")
             
@@ -179,12 +187,12 @@ class TextAnalyzer:
         words = [word for word in tokens if word.isalnum() and word not in stop_words and len(word) > 1]
         
         # 단어 빈도수 계산
-        word_count = Counter(words)
+        word_count = most_common_words(words, 30)  # 상위 30개 키워드
         total_words = len(words)
         
         # 키워드 및 밀도 계산
         keywords = []
-        for word, count in word_count.most_common(30):  # 상위 30개 키워드
+        for word, count in word_count:
             density = count / total_words if total_words > 0 else 0
             
             if page_id:
@@ -350,12 +358,12 @@ class TextAnalyzer:
         
         # 글로벌 분석 결과 저장
         global_file = os.path.join(output_dir, 'global_analysis.json')
-        with open(global_file, 'w', encoding='utf-8') as f:
-            json.dump({
+        with open(global_file, 'wb') as f:
+            f.write(orjson.dumps({
                 'website_url': results['website_url'],
                 'global_keywords': results['global_keywords'],
                 'knowledge_graph': results['knowledge_graph']
-            }, f, ensure_ascii=False, indent=2)
+            }, option=orjson.OPT_NON_STR_KEYS))
             
         # 페이지별 분석 결과 저장
         pages_dir = os.path.join(output_dir, 'pages')
@@ -364,8 +372,8 @@ class TextAnalyzer:
         page_files = []
         for page_analysis in results['page_analyses']:
             page_file = os.path.join(pages_dir, f"page_{page_analysis['page_id']}.json")
-            with open(page_file, 'w', encoding='utf-8') as f:
-                json.dump(page_analysis, f, ensure_ascii=False, indent=2)
+            with open(page_file, 'wb') as f:
+                f.write(orjson.dumps(page_analysis, option=orjson.OPT_NON_STR_KEYS))
                 
             page_files.append(page_file)
             
@@ -1,6 +1,7 @@
 import os
-import json
+import orjson
 import sqlite3
+from sqlalchemy.orm import selectinload
 from src.models.seo_data import db, Website, Page, Keyword, Link, TechnicalSEO
 
 class SEODataImporter:
@@ -22,16 +23,41 @@ class SEODataImporter:
         JSON 파일에서 SEO 데이터를 가져와 데이터베이스에 저장
         
         Args:
-            json_file (str): JSON 파일 경로
+            json_file (str): JSON 파일 경로 (.jsonl이면 한 줄씩 스트리밍으로 읽음)
             
         Returns:
             dict: 가져온 데이터 요약
         """
-        try:
-            # JSON 파일 읽기
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        if json_file.endswith('.jsonl'):
+            # JSON Lines: 첫 줄은 웹사이트/기술적 SEO 정보, 이후 줄은 페이지 데이터
+            with open(json_file, 'rb') as f:
+                header = orjson.loads(f.readline())
+                pages = (orjson.loads(line) for line in f if line.strip())
+                return self._import_data(json_file, header, pages)
                 
+        # JSON 파일 읽기
+        with open(json_file, 'rb') as f:
+            data = orjson.loads(f.read())
+            
+        return self._import_data(json_file, data, data['pages'])
+        
+    def _import_data(self, json_file, data, pages):
+        """
+        크롤링 데이터를 데이터베이스에 저장
+        
+        Args:
+            json_file (str): 원본 파일 경로 (지식 그래프 저장 위치 기준)
+            data (dict): 웹사이트 및 기술적 SEO 정보
+            pages (iterable): 페이지 데이터
+            
+        Returns:
+            dict: 가져온 데이터 요약
+        """
+        try:
+            # 지식 그래프 데이터는 별도의 JSON 파일로 저장
+            knowledge_graphs_dir = os.path.join(os.path.dirname(json_file), 'knowledge_graphs')
+            os.makedirs(knowledge_graphs_dir, exist_ok=True)
+            
             # 웹사이트 정보 저장
             website_url = data['website']['url']
             website = Website.query.filter_by(url=website_url).first()
@@ -71,7 +97,7 @@ class SEODataImporter:
             keywords_count = 0
             links_count = 0
             
-            for page_data in data['pages']:
+            for i, page_data in enumerate(pages):
                 # 이미 존재하는 페이지인지 확인
                 page = Page.query.filter_by(website_id=website.id, url=page_data['url']).first()
                 
@@ -106,16 +132,17 @@ class SEODataImporter:
                 Keyword.query.filter_by(page_id=page.id).delete()
                 Link.query.filter_by(page_id=page.id).delete()
                 
-                # 키워드 정보 저장
-                for kw_data in page_data['keywords']:
-                    keyword = Keyword(
-                        page_id=page.id,
-                        keyword=kw_data['keyword'],
-                        count=kw_data['count'],
-                        density=kw_data['density']
-                    )
-                    self.db.session.add(keyword)
-                    keywords_count += 1
+                # 키워드 정보 저장 (ORM 객체 생성 없이 일괄 삽입)
+                self.db.session.bulk_insert_mappings(Keyword, [
+                    {
+                        'page_id': page.id,
+                        'keyword': kw_data['keyword'],
+                        'count': kw_data['count'],
+                        'density': kw_data['density']
+                    }
+                    for kw_data in page_data['keywords']
+                ])
+                keywords_count += len(page_data['keywords'])
                     
                 # 링크 정보 저장
                 for link_data in page_data['links']:
@@ -129,6 +156,11 @@ class SEODataImporter:
                     self.db.session.add(link)
                     links_count += 1
                     
+                if 'knowledge_graph' in page_data:
+                    graph_file = os.path.join(knowledge_graphs_dir, f'graph_{i}.json')
+                    with open(graph_file, 'wb') as f:
+                        f.write(orjson.dumps(page_data['knowledge_graph'], option=orjson.OPT_NON_STR_KEYS))
+                    
                 # 주기적으로 커밋하여 메모리 사용량 관리
                 if pages_count % 10 == 0:
                     self.db.session.commit()
@@ -136,23 +168,13 @@ class SEODataImporter:
             # 최종 커밋
             self.db.session.commit()
             
-            # 지식 그래프 데이터는 별도의 JSON 파일로 저장
-            knowledge_graphs_dir = os.path.join(os.path.dirname(json_file), 'knowledge_graphs')
-            os.makedirs(knowledge_graphs_dir, exist_ok=True)
-            
-            for i, page_data in enumerate(data['pages']):
-                if 'knowledge_graph' in page_data:
-                    graph_file = os.path.join(knowledge_graphs_dir, f'graph_{i}.json')
-                    with open(graph_file, 'w', encoding='utf-8') as f:
-                        json.dump(page_data['knowledge_graph'], f, ensure_ascii=False, indent=2)
-            
             # 결과 요약
             summary = {
                 'website': website.url,
                 'pages_imported': pages_count,
                 'keywords_imported': keywords_count,
                 'links_imported': links_count,
-                'knowledge_graphs_saved': len(data['pages'])
+                'knowledge_graphs_saved': pages_count
             }
             
             return summary
@@ -262,7 +284,7 @@ class SEODataImporter:
                 )
                 
             # 페이지
-            pages = Page.query.all()
+            pages = Page.query.options(selectinload(Page.page_content)).all()
             for page in pages:
                 conn.execute(
                     "INSERT INTO pages (id, website_id, url, title, meta_description, h1, content, status_code, content_type, depth, is_homepage, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
@@ -1,15 +1,15 @@
 import requests
 from bs4 import BeautifulSoup
 import re
-import json
+import orjson
 import urllib.parse
 import time
-from collections import Counter
 import logging
 import nltk
 from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
 import networkx as nx
+from src.analyzer._fast import most_common_words
 
 # NLTK 데이터 다운로드
 try:
@@ -38,17 +38,19 @@ class SEOCrawler:
         self.max_depth = max_depth
         self.visited_urls = set()
         self.pages_data = []
+        self.pages_count = 0
+        self.sink = None
         self.technical_data = {
             'has_robots_txt': False,
             'robots_txt_content': '',
             'has_sitemap': False,
             'sitemap_url': '',
             'sitemap_content': '',
-            'core_web_vitals': json.dumps({
+            'core_web_vitals': orjson.dumps({
                 'LCP': None,  # Largest Contentful Paint
                 'FID': None,  # First Input Delay
                 'CLS': None,  # Cumulative Layout Shift
-            })
+            }).decode('utf-8')
         }
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
@@ -141,12 +143,12 @@ class SEOCrawler:
         words = [word for word in tokens if word.isalnum() and word not in stop_words and len(word) > 1]
         
         # 단어 빈도수 계산
-        word_count = Counter(words)
+        word_count = most_common_words(words, 30)  # 상위 30개 키워드
         total_words = len(words)
         
         # 키워드 및 밀도 계산
         keywords = []
-        for word, count in word_count.most_common(30):  # 상위 30개 키워드
+        for word, count in word_count:
             density = count / total_words if total_words > 0 else 0
             keywords.append({
                 'keyword': word,
@@ -243,13 +245,33 @@ class SEOCrawler:
         except Exception as e:
             self.logger.error(f"sitemap.xml 확인 중 오류 발생: {e}")
     
-    def crawl(self):
-        """웹사이트 크롤링 시작"""
+    def crawl(self, sink=None):
+        """
+        웹사이트 크롤링 시작
+        
+        Args:
+            sink (callable, optional): 레코드를 하나씩 전달받는 함수. 지정하면 첫 레코드로
+                웹사이트/기술적 SEO 정보를, 이후 페이지 데이터를 크롤링되는 즉시 전달하고
+                메모리에는 보관하지 않음
+                
+        Returns:
+            dict: 크롤링 결과 (sink 사용 시 pages는 비어 있음)
+        """
         self.logger.info(f"크롤링 시작: {self.base_url}")
+        self.sink = sink
         
         # robots.txt 및 sitemap.xml 확인
         self._check_robots_txt()
         
+        if self.sink:
+            self.sink({
+                'website': {
+                    'url': self.base_url,
+                    'domain': self.base_domain
+                },
+                'technical_seo': self.technical_data
+            })
+        
         # 홈페이지부터 크롤링 시작
         self._crawl_page(self.base_url, depth=0, is_homepage=True)
         
@@ -263,13 +285,13 @@ class SEOCrawler:
             'pages': self.pages_data
         }
         
-        self.logger.info(f"크롤링 완료: {len(self.pages_data)} 페이지")
+        self.logger.info(f"크롤링 완료: {self.pages_count} 페이지")
         return result
     
     def _crawl_page(self, url, depth=0, is_homepage=False):
         """개별 페이지 크롤링"""
         # 최대 깊이 또는 최대 페이지 수 확인
-        if depth > self.max_depth or len(self.pages_data) >= self.max_pages:
+        if depth > self.max_depth or self.pages_count >= self.max_pages:
             return
             
         # URL 정규화
@@ -333,7 +355,11 @@ class SEOCrawler:
                 'links': links
             }
             
-            self.pages_data.append(page_data)
+            if self.sink:
+                self.sink(page_data)
+            else:
+                self.pages_data.append(page_data)
+            self.pages_count += 1
             
             # 내부 링크 재귀적 크롤링
             if depth < self.max_depth:
@@ -357,8 +383,9 @@ class SEOCrawler:
             'pages': self.pages_data
         }
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
+        # 사람이 읽는 파일이므로 들여쓰기는 유지 (orjson은 UTF-8 바이트를 바로 반환)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
             
         self.logger.info(f"크롤링 결과가 {filename}에 저장되었습니다.")
         return filename
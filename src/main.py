@@ -1,6 +1,6 @@
 import sys
 import os
-import nltk
+import functools
 
 # Add project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
@@ -10,33 +10,57 @@ if os.path.exists("/opt/homebrew/lib"):
     os.environ["DYLD_LIBRARY_PATH"] = "/opt/homebrew/lib:" + os.environ.get("DYLD_LIBRARY_PATH", "")
     os.environ["PKG_CONFIG_PATH"] = "/opt/homebrew/lib/pkgconfig:" + os.environ.get("PKG_CONFIG_PATH", "")
 
-# Configure NLTK data path to use ~/Utilities/nltk_data
-nltk_data_path = os.path.expanduser("~/Utilities/nltk_data")
-if os.path.exists(nltk_data_path):
-    nltk.data.path.insert(0, nltk_data_path)
-    print(f"Using NLTK data from: {nltk_data_path}")
-else:
-    print(f"NLTK data path not found: {nltk_data_path}")
-    print("NLTK will use default data locations")
-
-from flask import Flask, render_template, jsonify, request, send_file, redirect, url_for
-import json
+@functools.cache
+def configure_nltk_data_path():
+    """Configure NLTK data path to use ~/Utilities/nltk_data (once per process)"""
+    import nltk
+    
+    nltk_data_path = os.path.expanduser("~/Utilities/nltk_data")
+    if os.path.exists(nltk_data_path):
+        nltk.data.path.insert(0, nltk_data_path)
+        print(f"Using NLTK data from: {nltk_data_path}")
+    else:
+        print(f"NLTK data path not found: {nltk_data_path}")
+        print("NLTK will use default data locations")
+
+from flask import Flask, Response, render_template, jsonify, request, send_from_directory, redirect, url_for, stream_with_context
+from werkzeug.exceptions import NotFound
+from werkzeug.routing import BaseConverter
+from flask.json.provider import DefaultJSONProvider
+import orjson
+import hashlib
+import time
 import tempfile
-from werkzeug.utils import secure_filename
+import shutil
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from urllib.parse import quote
-from src.models.seo_data import db, Website, Page, Keyword, Link, TechnicalSEO
-from src.crawler.seo_crawler import SEOCrawler
-from src.crawler.data_importer import SEODataImporter
-from src.analyzer.text_analyzer import TextAnalyzer
-from src.analyzer.technical_seo_checker import TechnicalSEOChecker
-from src.analyzer.page_ranker import PageRanker
-from src.analyzer.onpage_seo_analyzer import OnPageSEOAnalyzer
-from src.report.report_generator import ReportGenerator
-from src.presentation.presentation_designer import PresentationDesigner
+from src.models.seo_data import db, Website, Page, Keyword, Link, TechnicalSEO, AuditSession, migrate_legacy_page_content
+
+class SidConverter(BaseConverter):
+    """세션 ID(blake2b 24자리 16진수)만 매칭하는 URL 변환기"""
+    regex = r'[a-f0-9]{24}'
+
+class ORJSONProvider(DefaultJSONProvider):
+    """jsonify 응답을 orjson으로 직렬화하는 JSON 프로바이더"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+app.url_map.converters['sid'] = SidConverter
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///seo_audit.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# 상태 조회와 파이프라인 쓰기가 겹치면 SQLite 잠금 해제를 최대 30초 대기
+# (파일 DB의 check_same_thread=False는 SQLAlchemy 기본값이므로 따로 지정하지 않음)
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'connect_args': {'timeout': 30}
+}
 app.config['UPLOAD_FOLDER'] = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'uploads')
 app.config['REPORTS_FOLDER'] = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'reports')
 app.config['CHARTS_FOLDER'] = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'charts')
@@ -50,6 +74,38 @@ os.makedirs(app.config['PRESENTATIONS_FOLDER'], exist_ok=True)
 
 db.init_app(app)
 
+# Create tables at startup so the first request (e.g. /audit) never hits a missing table,
+# and move page bodies of databases created before page_contents existed
+with app.app_context():
+    db.create_all()
+    migrate_legacy_page_content()
+
+@functools.cache
+def get_render_executor():
+    """Process pool for PPTX/PDF rendering, created on first use and shared across requests.
+
+    Workers are spawned rather than forked so they never inherit the state of
+    the server's threads (locks, DB connections).
+    """
+    return ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context('spawn'))
+
+def run_render_jobs(*jobs):
+    """Run (fn, *args) jobs on the render pool and return their results in order.
+
+    A worker that died (OOM, crash in a native renderer) leaves the pool broken
+    for good, so the pool is discarded and the jobs are retried once on a new one.
+    """
+    for attempt in range(2):
+        executor = get_render_executor()
+        try:
+            futures = [executor.submit(fn, *args) for fn, *args in jobs]
+            return [future.result() for future in futures]
+        except BrokenProcessPool:
+            get_render_executor.cache_clear()
+            executor.shutdown(wait=False, cancel_futures=True)
+            if attempt:
+                raise
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -60,8 +116,12 @@ def audit():
     if not url:
         return jsonify({'error': 'URL is required.'}), 400
         
-    # Generate session ID
-    session_id = secure_filename(url.replace('://', '_').replace('/', '_'))
+    # Generate session ID (fixed-length hash so deep URLs stay filesystem-safe)
+    session_id = hashlib.blake2b(url.encode('utf-8'), digest_size=12).hexdigest()
+    
+    # Remember which URL the session belongs to
+    db.session.merge(AuditSession(id=session_id, url=url))
+    db.session.commit()
     
     # Create working directory
     session_dir = os.path.join(app.config['UPLOAD_FOLDER'], session_id)
@@ -74,31 +134,57 @@ def audit():
         'redirect': url_for('audit_status', session_id=session_id) + f'?url={quote(url)}'
     })
 
-@app.route('/audit/<session_id>/status')
+@app.route('/audit/<sid:session_id>/status')
 def audit_status(session_id):
     return render_template('audit_status.html', session_id=session_id)
 
-@app.route('/api/audit/<session_id>/start', methods=['POST'])
+# Written to the session directory when the pipeline fails, so status polling can stop
+AUDIT_ERROR_MARKER = 'error.json'
+
+def write_audit_error(error_file, message):
+    """Record a failed audit as a terminal state for the status endpoints"""
+    with open(error_file, 'wb') as f:
+        f.write(orjson.dumps({'message': message}))
+
+@app.route('/api/audit/<sid:session_id>/start', methods=['POST'])
 def start_audit(session_id):
-    data = request.get_json()
+    data = request.get_json() or {}
     url = data.get('url')
     
+    if not url:
+        audit_session = db.session.get(AuditSession, session_id)
+        url = audit_session.url if audit_session else None
+        
     if not url:
         return jsonify({'error': 'URL is required.'}), 400
         
     # Create working directory
     session_dir = os.path.join(app.config['UPLOAD_FOLDER'], session_id)
     os.makedirs(session_dir, exist_ok=True)
+    error_file = os.path.join(session_dir, AUDIT_ERROR_MARKER)
+    # Session ids are derived from the URL, so clear the previous run's outputs;
+    # otherwise the status stream would report the old result as completed
+    reset_audit_outputs(session_dir)
+    
+    # Heavy pipeline modules are only needed here, so import them lazily
+    configure_nltk_data_path()
+    from src.crawler.seo_crawler import SEOCrawler
+    from src.crawler.data_importer import SEODataImporter
+    from src.analyzer.text_analyzer import TextAnalyzer
+    from src.analyzer.technical_seo_checker import TechnicalSEOChecker
+    from src.analyzer.page_ranker import PageRanker
+    from src.analyzer.onpage_seo_analyzer import OnPageSEOAnalyzer
+    from src.report.report_generator import ReportGenerator
+    from src.presentation.presentation_designer import PresentationDesigner, render_pptx, render_pdf
     
     try:
         # 1. Crawling
         crawler = SEOCrawler(url, max_pages=50, max_depth=3)
-        crawl_result = crawler.crawl()
         
-        # Save crawling results
-        crawl_file = os.path.join(session_dir, 'crawl_result.json')
-        with open(crawl_file, 'w', encoding='utf-8') as f:
-            json.dump(crawl_result, f, ensure_ascii=False, indent=2)
+        # Stream crawling results to JSON Lines as each page completes
+        crawl_file = os.path.join(session_dir, 'crawl_result.jsonl')
+        with open(crawl_file, 'wb') as out_fp:
+            crawler.crawl(sink=lambda record: out_fp.write(orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS) + b'\n'))
             
         # 2. Database initialization
         with app.app_context():
@@ -115,6 +201,7 @@ def start_audit(session_id):
                 normalized_url = url.rstrip('/') + '/'
                 website = Website.query.filter_by(url=normalized_url).first()
             if not website:
+                write_audit_error(error_file, 'Website information not found.')
                 return jsonify({'error': 'Website information not found.'}), 500
                 
             website_id = website.id
@@ -166,29 +253,27 @@ def start_audit(session_id):
             )
             
             # 9. Presentation design
-            with open(report_files['json'], 'r', encoding='utf-8') as f:
-                report_data = json.load(f)
+            with open(report_files['json'], 'rb') as f:
+                report_data = orjson.loads(f.read())
                 
-            charts_dir = os.path.join(app.config['CHARTS_FOLDER'], session_id)
-            os.makedirs(charts_dir, exist_ok=True)
-            
             presentation_dir = os.path.join(app.config['PRESENTATIONS_FOLDER'], session_id)
             os.makedirs(presentation_dir, exist_ok=True)
             
             designer = PresentationDesigner(report_data)
-            charts = designer.generate_charts(charts_dir)
+            charts = designer.generate_charts()  # PNG bytes kept in memory
             
             # Generate HTML presentation
             html_file = os.path.join(presentation_dir, 'presentation.html')
             designer.generate_presentation_html(charts, html_file)
             
-            # Generate PPTX
+            # Generate PPTX and PDF in parallel (independent CPU-bound renders)
             pptx_file = os.path.join(presentation_dir, 'presentation.pptx')
-            designer.generate_pptx(charts, pptx_file)
-            
-            # Generate PDF
             pdf_file = os.path.join(presentation_dir, 'presentation.pdf')
-            designer.generate_pdf(html_file, pdf_file)
+            # Workers get only the report data, chart PNGs and HTML, not the whole designer
+            run_render_jobs(
+                (render_pptx, report_data, charts, pptx_file),
+                (render_pdf, designer.pdf_html, pdf_file, presentation_dir)
+            )
             
             # Save results
             result = {
@@ -202,7 +287,7 @@ def start_audit(session_id):
                 'ranked_pages': ranking_file,
                 'onpage_seo': onpage_file,
                 'report': report_files,
-                'charts': charts,
+                'charts': [name for name, png_data in charts.items() if png_data],
                 'presentation': {
                     'html': html_file,
                     'pptx': pptx_file,
@@ -212,8 +297,8 @@ def start_audit(session_id):
             
             # Save result file
             result_file = os.path.join(session_dir, 'result.json')
-            with open(result_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, ensure_ascii=False, indent=2)
+            with open(result_file, 'wb') as f:
+                f.write(orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS))
                 
             return jsonify({
                 'status': 'success',
@@ -232,69 +317,152 @@ def start_audit(session_id):
         import traceback
         error_details = traceback.format_exc()
         print(f"Audit error: {error_details}")  # Log to console for debugging
+        write_audit_error(error_file, f'An error occurred during audit: {str(e)}')
         return jsonify({
             'status': 'error',
             'message': f'An error occurred during audit: {str(e)}'
         }), 500
 
-@app.route('/api/audit/<session_id>/status', methods=['GET'])
-def check_audit_status(session_id):
+# Files written to the session directory as each pipeline stage finishes,
+# mapped to the step the audit has reached (see audit_status.html)
+AUDIT_STAGE_MARKERS = [
+    ('onpage_seo.json', 7),
+    ('ranked_pages.json', 6),
+    ('technical_seo.json', 5),
+    ('text_analysis', 4),
+    ('knowledge_graphs', 2),
+    ('crawl_result.jsonl', 1),
+]
+
+def reset_audit_outputs(session_dir):
+    """Remove the result, error and stage marker files left by a previous run of the same session"""
+    for name in ('result.json', AUDIT_ERROR_MARKER, *(name for name, _ in AUDIT_STAGE_MARKERS)):
+        path = os.path.join(session_dir, name)
+        if os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+def get_audit_state(session_id):
+    """Build the audit status payload from the files present in the session directory"""
     session_dir = os.path.join(app.config['UPLOAD_FOLDER'], session_id)
-    result_file = os.path.join(session_dir, 'result.json')
-    
-    if os.path.exists(result_file):
-        with open(result_file, 'r', encoding='utf-8') as f:
-            result = json.load(f)
-            
-        return jsonify({
+    # Open the result directly; a missing file means the audit is still running
+    try:
+        with open(os.path.join(session_dir, 'result.json'), 'rb') as f:
+            result = orjson.loads(f.read())
+    except FileNotFoundError:
+        result = None
+        
+    if result is not None:
+        return {
             'status': 'completed',
             'result': {
                 'session_id': session_id,
+                'website_url': result.get('website_url'),
                 'presentation_url': url_for('view_presentation', session_id=session_id),
                 'download': {
                     'pptx': url_for('download_pptx', session_id=session_id),
                     'pdf': url_for('download_pdf', session_id=session_id)
                 }
             }
-        })
-    else:
-        return jsonify({
-            'status': 'in_progress',
-            'message': 'Audit is in progress.'
-        })
+        }
+        
+    # A failed pipeline leaves an error marker instead of result.json
+    try:
+        with open(os.path.join(session_dir, AUDIT_ERROR_MARKER), 'rb') as f:
+            error = orjson.loads(f.read())
+    except FileNotFoundError:
+        error = None
+        
+    if error is not None:
+        return {
+            'status': 'error',
+            'message': error.get('message', 'An error occurred during audit.')
+        }
+        
+    try:
+        with os.scandir(session_dir) as entries:
+            names = {entry.name for entry in entries}
+    except FileNotFoundError:
+        names = set()
+        
+    step = next((step for name, step in AUDIT_STAGE_MARKERS if name in names), 1)
+    audit_session = db.session.get(AuditSession, session_id)
+    return {
+        'status': 'in_progress',
+        'step': step,
+        'website_url': audit_session.url if audit_session else None,
+        'message': 'Audit is in progress.'
+    }
 
-@app.route('/presentation/<session_id>')
+@app.route('/api/audit/<sid:session_id>/status', methods=['GET'])
+def check_audit_status(session_id):
+    return jsonify(get_audit_state(session_id))
+
+# Status stream tuning: poll interval, keepalive comment interval and overall lifetime (seconds)
+AUDIT_EVENTS_POLL_INTERVAL = 0.5
+AUDIT_EVENTS_KEEPALIVE_INTERVAL = 15
+AUDIT_EVENTS_TIMEOUT = 30 * 60
+
+@app.route('/api/audit/<sid:session_id>/events')
+def audit_events(session_id):
+    def generate():
+        last_state = None
+        started = last_sent = time.monotonic()
+        while True:
+            state = get_audit_state(session_id)
+            now = time.monotonic()
+            if state != last_state:
+                yield f"data: {orjson.dumps(state).decode('utf-8')}\n\n"
+                last_state = state
+                last_sent = now
+            elif now - last_sent >= AUDIT_EVENTS_KEEPALIVE_INTERVAL:
+                # Periodic writes surface a client disconnect as an error on the next yield
+                yield ": keepalive\n\n"
+                last_sent = now
+            if state['status'] in ('completed', 'error'):
+                break
+            if now - started >= AUDIT_EVENTS_TIMEOUT:
+                timeout_state = {'status': 'error', 'message': 'Timed out waiting for the audit to finish.'}
+                yield f"data: {orjson.dumps(timeout_state).decode('utf-8')}\n\n"
+                break
+            # Release the pooled connection while waiting for the next stage
+            db.session.remove()
+            time.sleep(AUDIT_EVENTS_POLL_INTERVAL)
+            
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache'})
+
+@app.route('/presentation/<sid:session_id>')
 def view_presentation(session_id):
-    presentation_file = os.path.join(app.config['PRESENTATIONS_FOLDER'], session_id, 'presentation.html')
+    presentation_dir = os.path.join(app.config['PRESENTATIONS_FOLDER'], session_id)
     
-    if not os.path.exists(presentation_file):
+    try:
+        return send_from_directory(presentation_dir, 'presentation.html')
+    except NotFound:
         return render_template('error.html', message='Presentation not found.')
-        
-    with open(presentation_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-        
-    return content
 
-@app.route('/download/<session_id>/pptx')
+@app.route('/download/<sid:session_id>/pptx')
 def download_pptx(session_id):
-    pptx_file = os.path.join(app.config['PRESENTATIONS_FOLDER'], session_id, 'presentation.pptx')
+    presentation_dir = os.path.join(app.config['PRESENTATIONS_FOLDER'], session_id)
     
-    if not os.path.exists(pptx_file):
+    try:
+        return send_from_directory(presentation_dir, 'presentation.pptx', as_attachment=True, download_name='seo_audit_report.pptx')
+    except NotFound:
         return render_template('error.html', message='PPTX file not found.')
-        
-    return send_file(pptx_file, as_attachment=True, download_name='seo_audit_report.pptx')
 
-@app.route('/download/<session_id>/pdf')
+@app.route('/download/<sid:session_id>/pdf')
 def download_pdf(session_id):
-    pdf_file = os.path.join(app.config['PRESENTATIONS_FOLDER'], session_id, 'presentation.pdf')
+    presentation_dir = os.path.join(app.config['PRESENTATIONS_FOLDER'], session_id)
     
-    if not os.path.exists(pdf_file):
+    try:
+        return send_from_directory(presentation_dir, 'presentation.pdf', as_attachment=True, download_name='seo_audit_report.pdf')
+    except NotFound:
         return render_template('error.html', message='PDF file not found.')
-        
-    return send_file(pdf_file, as_attachment=True, download_name='seo_audit_report.pdf')
 
 if __name__ == '__main__':
-    with app.app_context():
-        db.create_all()
     print("Starting SEO Audit application on http://localhost:5001")
     app.run(host='0.0.0.0', port=5001, debug=True)
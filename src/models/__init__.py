@@ -1 +1 @@
-from src.models.seo_data import db, Website, Page, Keyword, Link, TechnicalSEO
+from src.models.seo_data import db, Website, Page, PageContent, Keyword, Link, TechnicalSEO, AuditSession
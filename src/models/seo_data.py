@@ -26,7 +26,6 @@ class Page(db.Model):
     title = db.Column(db.Text)
     meta_description = db.Column(db.Text)
     h1 = db.Column(db.Text)
-    content = db.Column(db.Text)
     status_code = db.Column(db.Integer)
     content_type = db.Column(db.String(100))
     depth = db.Column(db.Integer, default=0)
@@ -36,10 +35,55 @@ class Page(db.Model):
     # Relationships
     keywords = db.relationship('Keyword', backref='page', lazy=True, cascade="all, delete-orphan")
     links = db.relationship('Link', backref='page', lazy=True, cascade="all, delete-orphan")
+    page_content = db.relationship('PageContent', backref='page', lazy=True, uselist=False, cascade="all, delete-orphan")
+    
+    @property
+    def content(self):
+        # 본문은 page_contents 테이블에 분리 저장되며 접근 시에만 로드됨
+        return self.page_content.content if self.page_content else None
+    
+    @content.setter
+    def content(self, value):
+        if self.page_content is None:
+            self.page_content = PageContent(content=value)
+        else:
+            self.page_content.content = value
     
     def __repr__(self):
         return f'<Page {self.url}>'
 
+class PageContent(db.Model):
+    __tablename__ = 'page_contents'
+    
+    page_id = db.Column(db.Integer, db.ForeignKey('pages.id'), primary_key=True)
+    content = db.Column(db.Text)
+    
+    def __repr__(self):
+        return f'<PageContent for page_id {self.page_id}>'
+
+def migrate_legacy_page_content():
+    """
+    기존 DB의 pages.content 컬럼에 남아 있는 본문을 page_contents 테이블로 복사
+    (create_all은 기존 테이블을 변경하지 않으므로 본문 분리 이전에 만든 DB를 위해 호출)
+    
+    Returns:
+        int: 복사된 페이지 수
+    """
+    # 새로 만든 DB에는 pages.content 컬럼이 없으므로 복사할 것이 없음
+    columns = {column['name'] for column in db.inspect(db.engine).get_columns('pages')}
+    if 'content' not in columns:
+        return 0
+        
+    # 이미 복사된 페이지는 건너뛰므로 여러 번 호출해도 한 번만 복사됨
+    result = db.session.execute(db.text(
+        "INSERT INTO page_contents (page_id, content) "
+        "SELECT id, content FROM pages "
+        "WHERE content IS NOT NULL "
+        "AND NOT EXISTS (SELECT 1 FROM page_contents WHERE page_contents.page_id = pages.id)"
+    ))
+    db.session.commit()
+    return result.rowcount
+
 class Keyword(db.Model):
     __tablename__ = 'keywords'
     
@@ -80,3 +124,13 @@ class TechnicalSEO(db.Model):
     
     def __repr__(self):
         return f'<TechnicalSEO for website_id {self.website_id}>'
+
+class AuditSession(db.Model):
+    __tablename__ = 'sessions'
+    
+    id = db.Column(db.String(24), primary_key=True)  # blake2b(url) hex digest
+    url = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<AuditSession {self.id} {self.url}>'
@@ -1,3 +1,13 @@
+import matplotlib
+matplotlib.use('Agg')
+
+# 차트 렌더링 시 경로 단순화로 그리는 정점 수를 줄임
+matplotlib.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000
+})
+
 try:
     from src.presentation.presentation_designer import PresentationDesigner
 except ImportError as e:
@@ -6,9 +16,11 @@ except ImportError as e:
     class PresentationDesigner:
         def __init__(self, report_data):
             self.report_data = report_data
+            self.presentation_html = None
+            self.pdf_html = None
             print("Using mock PresentationDesigner - PDF generation will be limited")
         
-        def generate_charts(self, output_dir):
+        def generate_charts(self, output_dir=None):
             print("Charts generation not available")
             return {}
         
@@ -25,6 +37,8 @@ except ImportError as e:
             </body>
             </html>
             """
+            self.presentation_html = html_content
+            self.pdf_html = html_content
             with open(output_file, 'w', encoding='utf-8') as f:
                 f.write(html_content)
             return output_file
@@ -36,3 +50,7 @@ except ImportError as e:
         def generate_pdf(self, html_file, output_file):
             print("PDF generation not available")
             return None
+        
+        def generate_pdf_from_string(self, html_str, output_file, base_url=None):
+            print("PDF generation not available")
+            return None
@@ -0,0 +1,41 @@
+// 슬라이드 제어
+const slides = document.querySelectorAll('.slide');
+let currentSlide = 0;
+
+function showSlide(index) {
+    slides.forEach(slide => slide.classList.remove('active'));
+    slides[index].classList.add('active');
+    currentSlide = index;
+
+    // 버튼 상태 업데이트
+    document.getElementById('prev-btn').disabled = currentSlide === 0;
+    document.getElementById('next-btn').disabled = currentSlide === slides.length - 1;
+}
+
+document.getElementById('prev-btn').addEventListener('click', () => {
+    if (currentSlide > 0) {
+        showSlide(currentSlide - 1);
+    }
+});
+
+document.getElementById('next-btn').addEventListener('click', () => {
+    if (currentSlide < slides.length - 1) {
+        showSlide(currentSlide + 1);
+    }
+});
+
+// 키보드 제어
+document.addEventListener('keydown', (e) => {
+    if (e.key === 'ArrowLeft') {
+        if (currentSlide > 0) {
+            showSlide(currentSlide - 1);
+        }
+    } else if (e.key === 'ArrowRight') {
+        if (currentSlide < slides.length - 1) {
+            showSlide(currentSlide + 1);
+        }
+    }
+});
+
+// 초기 상태 설정
+showSlide(0);
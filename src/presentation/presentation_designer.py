@@ -1,20 +1,37 @@
 import json
+import logging
 import os
 from flask import render_template, jsonify, request, send_file
 from pptx import Presentation
-import matplotlib.pyplot as plt
+import re
 import matplotlib
-import numpy as np
+matplotlib.use('Agg')
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_svg import FigureCanvasSVG
+import math
 import io
-import base64
+from concurrent.futures import ThreadPoolExecutor
+import binascii
+from PIL import Image
+import functools
+import textwrap
+from importlib.resources import files
+from urllib.parse import urlsplit
+import jinja2
+
+logger = logging.getLogger(__name__)
+
+# WeasyPrint 없이 내보낼 때 사용하는 안내 문구만 담긴 최소 PDF
+_PLACEHOLDER_PDF = b'%PDF-1.4\n1 0 obj\n<</Type/Catalog/Pages 2 0 R>>\nendobj\n2 0 obj\n<</Type/Pages/Kids[3 0 R]/Count 1>>\nendobj\n3 0 obj\n<</Type/Page/Parent 2 0 R/Contents 4 0 R>>\nendobj\n4 0 obj\n<</Length 44>>stream\nBT\n/F1 12 Tf\n72 720 Td\n(PDF generation not available) Tj\nET\nendstream\nendobj\nxref\n0 5\n0000000000 65535 f \n0000000009 00000 n \n0000000058 00000 n \n0000000115 00000 n \n0000000175 00000 n \ntrailer\n<</Size 5/Root 1 0 R>>\nstartxref\n271\n%%EOF'
 
 # Conditional import for WeasyPrint with fallback
 try:
     from weasyprint import HTML
     WEASYPRINT_AVAILABLE = True
-    print("WeasyPrint is available")
+    logger.info("WeasyPrint is available")
 except ImportError as e:
-    print(f"WeasyPrint not available: {e}")
+    logger.warning(f"WeasyPrint not available: {e}")
     WEASYPRINT_AVAILABLE = False
     
     # Create a mock HTML class
@@ -25,16 +42,34 @@ except ImportError as e:
         def write_pdf(self, output_file):
             # Create a simple placeholder PDF message
             with open(output_file, 'wb') as f:
-                f.write(b'%PDF-1.4\n1 0 obj\n<</Type/Catalog/Pages 2 0 R>>\nendobj\n2 0 obj\n<</Type/Pages/Kids[3 0 R]/Count 1>>\nendobj\n3 0 obj\n<</Type/Page/Parent 2 0 R/Contents 4 0 R>>\nendobj\n4 0 obj\n<</Length 44>>stream\nBT\n/F1 12 Tf\n72 720 Td\n(PDF generation not available) Tj\nET\nendstream\nendobj\nxref\n0 5\n0000000000 65535 f \n0000000009 00000 n \n0000000058 00000 n \n0000000115 00000 n \n0000000175 00000 n \ntrailer\n<</Size 5/Root 1 0 R>>\nstartxref\n271\n%%EOF')
+                f.write(_PLACEHOLDER_PDF)
             return output_file
 
 # 한글 폰트 설정 (macOS 호환)
-try:
-    # macOS에서 사용 가능한 한글 폰트 시도
-    import matplotlib.font_manager as fm
+# 조회한 폰트 이름과 파일 경로를 캐시 파일에 기록하여 이후 워커 기동 시 폰트 목록 탐색 생략
+FONT_CACHE_FILE = os.path.expanduser('~/.cache/seo_audit_font')
+
+# 한글 폰트를 찾지 못했을 때 matplotlib이 대신 선택하는 기본 폰트 (캐시하지 않음)
+FALLBACK_FONT = 'DejaVu Sans'
+
+def _resolve_font():
+    """
+    차트에 사용할 한글 폰트 이름 조회 (캐시된 폰트 파일이 아직 있으면 그 값을 사용)
     
-    # 사용 가능한 폰트 목록에서 한글 폰트 찾기
-    font_list = [f.name for f in fm.fontManager.ttflist]
+    Returns:
+        str: 폰트 이름
+    """
+    try:
+        with open(FONT_CACHE_FILE, encoding='utf-8') as f:
+            cached_font, _, cached_path = f.read().strip().partition('\n')
+        # 폰트가 삭제·이동된 경우 캐시를 무시하고 다시 조회
+        if cached_font and cached_path and os.path.isfile(cached_path):
+            return cached_font
+    except OSError:
+        pass
+        
+    # macOS에서 사용 가능한 한글 폰트 시도
+    from matplotlib.font_manager import FontProperties, findfont
     
     # 우선순위 순으로 한글 폰트 시도
     korean_fonts = [
@@ -42,27 +77,490 @@ try:
         'NanumGothic',      # 나눔고딕
         'Malgun Gothic',    # 맑은 고딕 (Windows)
         'Noto Sans CJK KR', # 구글 Noto 폰트
-        'DejaVu Sans',      # 기본 폰트
+        FALLBACK_FONT,      # 기본 폰트
         'sans-serif'        # 시스템 기본 폰트
     ]
     
-    # 첫 번째로 사용 가능한 폰트 선택
-    selected_font = 'DejaVu Sans'  # 기본값
-    for font in korean_fonts:
-        if font in font_list:
-            selected_font = font
-            break
+    # 첫 번째로 사용 가능한 폰트 선택 (matplotlib 내부 캐시를 사용하는 findfont로 조회)
+    font_path = findfont(FontProperties(family=korean_fonts), fallback_to_default=True)
+    selected_font = FontProperties(fname=font_path).get_name()
     
+    # 기본 폰트로 대체된 경우 캐시하지 않아 이후 설치된 한글 폰트를 다음 기동 시 찾을 수 있게 함
+    if selected_font == FALLBACK_FONT:
+        return selected_font
+        
+    # 캐시 파일 기록 (실패해도 다음 기동 시 다시 조회하면 되므로 무시)
+    try:
+        os.makedirs(os.path.dirname(FONT_CACHE_FILE), exist_ok=True)
+        with open(FONT_CACHE_FILE, 'w', encoding='utf-8') as f:
+            f.write(f'{selected_font}\n{font_path}')
+    except OSError:
+        pass
+        
+    return selected_font
+
+try:
+    selected_font = _resolve_font()
     matplotlib.rcParams['font.family'] = selected_font
     matplotlib.rcParams['axes.unicode_minus'] = False
-    print(f"Using font: {selected_font}")
+    logger.info(f"Using font: {selected_font}")
     
 except Exception as e:
-    print(f"Font configuration failed: {e}")
+    logger.exception(f"Font configuration failed: {e}")
     # 기본 폰트 사용
-    matplotlib.rcParams['font.family'] = 'DejaVu Sans'
+    matplotlib.rcParams['font.family'] = FALLBACK_FONT
     matplotlib.rcParams['axes.unicode_minus'] = False
 
+# 차트가 없을 때 사용하는 1x1 투명 PNG
+_PLACEHOLDER_DATAURI = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="
+
+# 기술적 SEO 차트 카테고리 이름 → 보고서 데이터 키 (차트 표시 순서)
+_CATEGORY_KEY_MAP = {
+    'robots.txt': 'robots_txt',
+    'sitemap.xml': 'sitemap',
+    '사이트 구조': 'site_structure',
+    'Core Web Vitals': 'core_web_vitals',
+    '리다이렉트': 'redirects',
+    '표준 링크': 'canonical',
+    '메타 태그': 'meta_tags',
+    '구조화된 데이터': 'structured_data',
+    '링크': 'links',
+    '모바일 친화성': 'mobile_friendly',
+    '보안': 'security',
+    '페이지 속도': 'page_speed'
+}
+
+# 슬라이드 제어 스크립트 (패키지 자산 파일을 모듈 로드 시 한 번만 읽어 템플릿 들여쓰기에 맞춤)
+_CONTROLS_JS = textwrap.indent(
+    files('src.presentation').joinpath('assets', 'controls.js').read_text(encoding='utf-8'),
+    '        '
+)
+
+# 프레젠테이션 HTML 공통 스타일 (호출마다 다시 만들지 않도록 모듈 상수로 유지)
+_PRESENTATION_CSS = """        :root {
+            --primary-color: #4a6fa5;
+            --secondary-color: #5b8c5a;
+            --accent-color: #d98c5f;
+            --text-color: #333;
+            --background-color: #fff;
+            --slide-background: #f9f9f9;
+        }
+        
+        body {
+            font-family: 'Noto Sans KR', Arial, sans-serif;
+            line-height: 1.6;
+            color: var(--text-color);
+            background-color: var(--background-color);
+            margin: 0;
+            padding: 0;
+        }
+        
+        .presentation-container {
+            max-width: 1000px;
+            margin: 0 auto;
+            padding: 20px;
+        }
+        
+        .controls {
+            position: fixed;
+            bottom: 20px;
+            left: 0;
+            right: 0;
+            text-align: center;
+            z-index: 100;
+        }
+        
+        .controls button {
+            background-color: var(--primary-color);
+            color: white;
+            border: none;
+            padding: 10px 20px;
+            margin: 0 5px;
+            border-radius: 5px;
+            cursor: pointer;
+            font-size: 16px;
+        }
+        
+        .controls button:hover {
+            background-color: #3a5a8c;
+        }
+        
+        .slide {
+            display: none;
+            background-color: var(--slide-background);
+            border-radius: 10px;
+            padding: 40px;
+            margin-bottom: 20px;
+            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+            min-height: 500px;
+            position: relative;
+        }
+        
+        .slide.active {
+            display: block;
+        }
+        
+        .slide-number {
+            position: absolute;
+            bottom: 10px;
+            right: 20px;
+            font-size: 14px;
+            color: #999;
+        }
+        
+        h1, h2, h3 {
+            color: var(--primary-color);
+        }
+        
+        h1 {
+            font-size: 2.5em;
+            margin-bottom: 20px;
+            border-bottom: 2px solid var(--primary-color);
+            padding-bottom: 10px;
+        }
+        
+        h2 {
+            font-size: 2em;
+            margin-top: 0;
+        }
+        
+        ul, ol {
+            margin-bottom: 20px;
+        }
+        
+        li {
+            margin-bottom: 10px;
+        }
+        
+        .chart-container {
+            text-align: center;
+            margin: 20px 0;
+        }
+        
+        .chart-container img, .chart-container svg {
+            max-width: 100%;
+            height: auto;
+            border-radius: 5px;
+            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+        }
+        
+        .score-container {
+            display: flex;
+            justify-content: space-around;
+            margin: 30px 0;
+        }
+        
+        .score-box {
+            text-align: center;
+            padding: 20px;
+            border-radius: 10px;
+            width: 25%;
+            color: white;
+        }
+        
+        .score-box.overall {
+            background-color: var(--primary-color);
+        }
+        
+        .score-box.technical {
+            background-color: var(--secondary-color);
+        }
+        
+        .score-box.onpage {
+            background-color: var(--accent-color);
+        }
+        
+        .score-value {
+            font-size: 3em;
+            font-weight: bold;
+            margin: 10px 0;
+        }
+        
+        .issues-container, .recommendations-container {
+            background-color: white;
+            padding: 20px;
+            border-radius: 5px;
+            margin: 20px 0;
+            box-shadow: 0 2px 5px rgba(0,0,0,0.05);
+        }
+        
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 20px 0;
+        }
+        
+        th, td {
+            border: 1px solid #ddd;
+            padding: 12px;
+            text-align: left;
+        }
+        
+        th {
+            background-color: var(--primary-color);
+            color: white;
+        }
+        
+        tr:nth-child(even) {
+            background-color: #f2f2f2;
+        }
+        
+        .download-container {
+            margin-top: 30px;
+            text-align: center;
+        }
+        
+        .download-button {
+            display: inline-block;
+            background-color: var(--primary-color);
+            color: white;
+            padding: 10px 20px;
+            border-radius: 5px;
+            text-decoration: none;
+            margin: 0 10px;
+        }
+        
+        .download-button:hover {
+            background-color: #3a5a8c;
+        }
+        
+        @media print {
+            .controls, .download-container {
+                display: none;
+            }
+            
+            .slide {
+                display: block;
+                break-after: page;
+                box-shadow: none;
+                min-height: auto;
+            }
+        }
+"""
+
+# 프레젠테이션 HTML 템플릿 (모듈 로드 시 한 번만 컴파일하고 호출마다 데이터만 채움)
+_PRESENTATION_TEMPLATE = jinja2.Environment(
+    autoescape=True,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True,
+    cache_size=-1
+).from_string("""{% macro chart(key, alt) %}{% if chart_svgs.get(key) %}{{ chart_svgs[key]|safe }}{% else %}<img src="{{ chart_images[key] }}" alt="{{ alt }}">{% endif %}{% endmacro %}
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{ page_title }}</title>
+    <style>
+{{ css|safe }}    </style>
+</head>
+<body>
+    <div class="presentation-container">
+        <!-- 슬라이드 1: 제목 -->
+        <div class="slide active" id="slide-1">
+            <h1>{{ heading }}</h1>
+            <p><strong>분석 날짜:</strong> {{ date }}</p>
+            <p><strong>웹사이트:</strong> {{ website_url }}</p>
+            <div class="chart-container">
+                {{ chart('scores', 'SEO 점수 차트') }}
+            </div>
+            <div class="slide-number">1 / 10</div>
+        </div>
+
+        <!-- 슬라이드 2: 개요 -->
+        <div class="slide" id="slide-2">
+            <h2>개요</h2>
+            <p>이 보고서는 {{ website_url }}의 SEO 상태에 대한 종합적인 분석을 제공합니다.</p>
+            <ul>
+                <li>검색 엔진 최적화(SEO)는 웹사이트의 가시성과 검색 엔진 순위를 향상시키는 과정입니다.</li>
+                <li>이 감사는 기술적 SEO, 온페이지 SEO, 키워드 분석을 포함합니다.</li>
+                <li>분석 날짜: {{ date }}</li>
+            </ul>
+            <div class="score-container">
+                <div class="score-box overall">
+                    <h3>전체 점수</h3>
+                    <div class="score-value">{{ scores['overall'] }}</div>
+                    <div>/ 100</div>
+                </div>
+                <div class="score-box technical">
+                    <h3>기술적 SEO</h3>
+                    <div class="score-value">{{ scores['technical'] }}</div>
+                    <div>/ 100</div>
+                </div>
+                <div class="score-box onpage">
+                    <h3>온페이지 SEO</h3>
+                    <div class="score-value">{{ scores['onpage'] }}</div>
+                    <div>/ 100</div>
+                </div>
+            </div>
+            <div class="slide-number">2 / 10</div>
+        </div>
+
+        <!-- 슬라이드 3: 주요 이슈 -->
+        <div class="slide" id="slide-3">
+            <h2>주요 이슈</h2>
+            <div class="issues-container">
+                <ul>
+                {% for issue in top_issues[:5] %}
+                    <li>{{ issue }}</li>
+                {% endfor %}
+                </ul>
+            </div>
+            <div class="chart-container">
+                {{ chart('technical_scores', '기술적 SEO 카테고리별 점수 차트') }}
+            </div>
+            <div class="slide-number">3 / 10</div>
+        </div>
+
+        <!-- 슬라이드 4: 개선 권장사항 -->
+        <div class="slide" id="slide-4">
+            <h2>개선 권장사항</h2>
+            <div class="recommendations-container">
+                <ul>
+                {% for rec in top_recommendations[:5] %}
+                    <li>{{ rec }}</li>
+                {% endfor %}
+                </ul>
+            </div>
+            <div class="slide-number">4 / 10</div>
+        </div>
+
+        <!-- 슬라이드 5: 기술적 SEO 분석 -->
+        <div class="slide" id="slide-5">
+            <h2>기술적 SEO 분석</h2>
+            <p>기술적 SEO는 검색 엔진이 웹사이트를 크롤링하고 색인화하는 방식에 영향을 미치는 요소입니다.</p>
+            <table>
+                <tr>
+                    <th>카테고리</th>
+                    <th>상태</th>
+                </tr>
+            {% for name, status in technical_rows %}
+                <tr>
+                    <td>{{ name }}</td>
+                    <td>{{ status }}</td>
+                </tr>
+            {% endfor %}
+            </table>
+            <div class="chart-container">
+                {{ chart('page_depth', '페이지 깊이별 분포 차트') }}
+            </div>
+            <div class="slide-number">5 / 10</div>
+        </div>
+
+        <!-- 슬라이드 6: 상위 키워드 분석 -->
+        <div class="slide" id="slide-6">
+            <h2>상위 키워드 분석</h2>
+            <p>키워드 분석은 웹사이트의 콘텐츠가 사용자의 검색 의도와 얼마나 잘 일치하는지 보여줍니다.</p>
+            <div class="chart-container">
+                {{ chart('keywords', '상위 키워드 차트') }}
+            </div>
+            <div class="slide-number">6 / 10</div>
+        </div>
+
+        <!-- 슬라이드 7: 상위 페이지 -->
+        <div class="slide" id="slide-7">
+            <h2>상위 페이지</h2>
+            <p>다음은 중요도에 따라 순위가 매겨진 상위 페이지입니다.</p>
+            <table>
+                <tr>
+                    <th>순위</th>
+                    <th>URL</th>
+                    <th>점수</th>
+                    <th>깊이</th>
+                    <th>내부 링크 수</th>
+                </tr>
+            {% for page in data['ranked_pages'][:5] %}
+                <tr>
+                    <td>{{ loop.index }}</td>
+                    <td>{{ shorten_url(page['url']) }}</td>
+                    <td>{{ page['score'] }}</td>
+                    <td>{{ page['depth'] }}</td>
+                    <td>{{ page['inbound_links'] }}</td>
+                </tr>
+            {% endfor %}
+            </table>
+            <div class="slide-number">7 / 10</div>
+        </div>
+
+        <!-- 슬라이드 8: 온페이지 SEO 분석 -->
+        <div class="slide" id="slide-8">
+            <h2>온페이지 SEO 분석</h2>
+            <p>온페이지 SEO는 개별 페이지의 콘텐츠와 HTML 소스 코드를 최적화하는 것을 의미합니다.</p>
+            <div class="chart-container">
+                {{ chart('onpage_scores', '온페이지 SEO 점수 차트') }}
+            </div>
+            {% if data['onpage_seo'] %}
+            <h3>주요 페이지 이슈</h3>
+            <table>
+                <tr>
+                    <th>페이지</th>
+                    <th>주요 이슈</th>
+                </tr>
+                {% for page in data['onpage_seo'][:3] %}
+                <tr>
+                    <td>{{ shorten_url(page['url']) }}</td>
+                    <td>{{ page['issues'][:2]|join(', ') if page['issues'] else '이슈 없음' }}</td>
+                </tr>
+                {% endfor %}
+            </table>
+            {% endif %}
+            <div class="slide-number">8 / 10</div>
+        </div>
+
+        <!-- 슬라이드 9: 다음 단계 -->
+        <div class="slide" id="slide-9">
+            <h2>다음 단계</h2>
+            <p>다음은 SEO를 개선하기 위한 권장 단계입니다.</p>
+
+            <h3>우선순위가 높은 작업</h3>
+            <ol>
+            {% for rec in short_term %}
+                <li>{{ rec }}</li>
+            {% endfor %}
+            </ol>
+
+            <h3>중기 작업</h3>
+            <ol>
+            {% for rec in mid_term %}
+                <li>{{ rec }}</li>
+            {% endfor %}
+            </ol>
+
+            <h3>장기 작업</h3>
+            <ol>
+            {% for rec in long_term %}
+                <li>{{ rec }}</li>
+            {% endfor %}
+            </ol>
+            <div class="slide-number">9 / 10</div>
+        </div>
+
+        <!-- 슬라이드 10: 감사합니다 -->
+        <div class="slide" id="slide-10">
+            <h2>감사합니다</h2>
+            <p>이 SEO 감사 보고서가 웹사이트의 검색 엔진 최적화를 개선하는 데 도움이 되기를 바랍니다.</p>
+            <p>질문이 있으시면 언제든지 문의해 주세요.</p>
+
+            <div class="download-container">
+                <a href="/download/pptx" class="download-button">PPTX 다운로드</a>
+                <a href="/download/pdf" class="download-button">PDF 다운로드</a>
+            </div>
+            <div class="slide-number">10 / 10</div>
+        </div>
+    </div>
+
+    <div class="controls">
+        <button id="prev-btn">이전</button>
+        <button id="next-btn">다음</button>
+    </div>
+
+    <script>
+{{ controls_js|safe }}    </script>
+</body>
+</html>
+""")
+
 class PresentationDesigner:
     """
     SEO 보고서 데이터를 기반으로 시각적 프레젠테이션을 디자인하는 클래스
@@ -77,70 +575,163 @@ class PresentationDesigner:
         """
         self.report_data = report_data
         self.charts_dir = None
+        self.chart_figures = {}
+        self.presentation_html = None
+        self.presentation_file = None
+        self.pdf_html = None
         
-    def generate_charts(self, output_dir):
+    def generate_charts(self, output_dir=None):
         """
         차트 생성
         
         Args:
-            output_dir (str): 차트 저장 디렉토리
+            output_dir (str, optional): 차트 PNG 파일도 저장할 디렉토리 (지정하지 않으면 메모리에만 보관)
             
         Returns:
-            dict: 생성된 차트 파일 경로
+            dict: 차트별 PNG 데이터 (bytes)
         """
         self.charts_dir = output_dir
-        os.makedirs(output_dir, exist_ok=True)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
         
         charts = {}
+        self.chart_figures = {}
+        
+        # 차트마다 독립된 Figure/Canvas를 사용하므로 스레드에서 동시에 렌더링
+        # (Agg 렌더링과 PNG 압축은 GIL을 해제하는 C 코드에서 수행됨)
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = {
+                'scores': executor.submit(self._render_chart, 'scores', self._generate_score_chart),
+                'keywords': executor.submit(self._render_chart, 'keywords', self._generate_keyword_chart),
+                'page_depth': executor.submit(self._render_chart, 'page_depth', self._generate_page_depth_chart),
+                'onpage_scores': executor.submit(self._render_chart, 'onpage_scores', self._generate_onpage_scores_chart),
+                'technical_scores': executor.submit(self._render_chart, 'technical_scores', self._generate_technical_scores_chart)
+            }
         
         try:
             # 점수 차트
-            charts['scores'] = self._generate_score_chart()
-            print("Generated scores chart")
+            charts['scores'] = futures['scores'].result()
+            logger.info("Generated scores chart")
         except Exception as e:
-            print(f"Error generating scores chart: {e}")
+            logger.exception(f"Error generating scores chart: {e}")
             charts['scores'] = None
         
         try:
             # 키워드 차트
-            charts['keywords'] = self._generate_keyword_chart()
-            print("Generated keywords chart")
+            charts['keywords'] = futures['keywords'].result()
+            logger.info("Generated keywords chart")
         except Exception as e:
-            print(f"Error generating keywords chart: {e}")
+            logger.exception(f"Error generating keywords chart: {e}")
             charts['keywords'] = None
         
         try:
             # 페이지 깊이 분포 차트
-            charts['page_depth'] = self._generate_page_depth_chart()
-            print("Generated page depth chart")
+            charts['page_depth'] = futures['page_depth'].result()
+            logger.info("Generated page depth chart")
         except Exception as e:
-            print(f"Error generating page depth chart: {e}")
+            logger.exception(f"Error generating page depth chart: {e}")
             charts['page_depth'] = None
         
         try:
             # 온페이지 SEO 점수 차트
-            charts['onpage_scores'] = self._generate_onpage_scores_chart()
-            print("Generated onpage scores chart")
+            charts['onpage_scores'] = futures['onpage_scores'].result()
+            logger.info("Generated onpage scores chart")
         except Exception as e:
-            print(f"Error generating onpage scores chart: {e}")
+            logger.exception(f"Error generating onpage scores chart: {e}")
             charts['onpage_scores'] = None
         
-        try:
-            # 기술적 SEO 카테고리 점수 차트
-            charts['technical_scores'] = self._generate_technical_scores_chart()
-            print("Generated technical scores chart")
-        except Exception as e:
-            print(f"Error generating technical scores chart: {e}")
-            charts['technical_scores'] = None
+        try:
+            # 기술적 SEO 카테고리 점수 차트
+            charts['technical_scores'] = futures['technical_scores'].result()
+            logger.info("Generated technical scores chart")
+        except Exception as e:
+            logger.exception(f"Error generating technical scores chart: {e}")
+            charts['technical_scores'] = None
+        
+        return charts
+    
+    def _prepare_figure(self, figsize):
+        """
+        차트용 Figure 생성 (pyplot 전역 상태 없이 Agg 캔버스에 연결)
+        
+        Args:
+            figsize (tuple): 그림 크기 (인치)
+            
+        Returns:
+            Figure: 새 Figure
+        """
+        fig = Figure(figsize=figsize, dpi=100)
+        FigureCanvasAgg(fig)
+        return fig
+    
+    def _render_chart(self, name, draw):
+        """
+        차트를 그린 뒤 PPTX/PDF용 PNG로 렌더링
+        (Figure는 보관해 두었다가 HTML 생성 시에만 SVG로 렌더링)
+        
+        Args:
+            name (str): 차트 이름
+            draw (callable): 차트 Figure를 생성하는 메서드
+            
+        Returns:
+            bytes: PNG 데이터
+        """
+        fig = draw()
+        png_data = self._render_png(fig, f'{name}_chart.png')
+        self.chart_figures[name] = fig
+        return png_data
+    
+    def _render_svg(self, fig):
+        """
+        Figure를 HTML에 직접 삽입할 SVG 마크업으로 렌더링
+        
+        Args:
+            fig (Figure): 렌더링할 Figure
+            
+        Returns:
+            str: <svg> 요소 마크업
+        """
+        buffer = io.StringIO()
+        FigureCanvasSVG(fig).print_svg(buffer, metadata={'Date': None, 'Creator': None, 'Format': None, 'Type': None})
+        svg = buffer.getvalue()
         
-        return charts
+        # XML 선언과 DOCTYPE을 제외한 <svg> 요소만 사용
+        return svg[svg.index('<svg'):]
+    
+    def _render_png(self, fig, filename):
+        """
+        Figure를 PNG 바이트로 렌더링
+        
+        Args:
+            fig (Figure): 렌더링할 Figure
+            filename (str): charts_dir 지정 시 저장할 파일 이름
+            
+        Returns:
+            bytes: PNG 데이터
+        """
+        # Agg 캔버스에 그린 RGBA 버퍼를 복사 없이 PIL로 넘겨 바로 PNG로 인코딩
+        canvas = fig.canvas
+        canvas.draw()
+        rgba = canvas.buffer_rgba()
+        image = Image.frombuffer('RGBA', (rgba.shape[1], rgba.shape[0]), rgba, 'raw', 'RGBA', 0, 1)
+        
+        # 메타데이터(tEXt) 청크 없이 저장하고 PIL의 optimize 패스는 생략
+        buffer = io.BytesIO()
+        image.save(buffer, 'PNG', compress_level=1, optimize=False)
+        png_data = buffer.getvalue()
+        
+        if self.charts_dir:
+            with open(os.path.join(self.charts_dir, filename), 'wb') as f:
+                f.write(png_data)
+                
+        return png_data
     
     def _generate_score_chart(self):
         """
         SEO 점수 차트 생성
         
         Returns:
-            str: 차트 파일 경로
+            Figure: 차트 Figure
         """
         scores = self.report_data['scores']
         
@@ -152,42 +743,34 @@ class PresentationDesigner:
         colors = ['#4a6fa5', '#5b8c5a', '#d98c5f']
         
         # 그림 크기 설정
-        plt.figure(figsize=(8, 5))
+        fig = self._prepare_figure((8, 5))
+        ax = fig.add_subplot(111)
         
         # 바 차트 생성
-        bars = plt.bar(categories, values, color=colors, width=0.6)
+        bars = ax.bar(categories, values, color=colors, width=0.6)
         
         # 바 위에 값 표시
-        for bar in bars:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., height + 1,
-                    f'{height:.1f}',
-                    ha='center', va='bottom', fontsize=12)
+        ax.bar_label(bars, fmt='%.1f', padding=3, fontsize=12)
         
         # 축 및 제목 설정
-        plt.ylim(0, 105)  # 최대값을 100보다 약간 높게 설정하여 텍스트 공간 확보
-        plt.ylabel('점수 (100점 만점)', fontsize=12)
-        plt.title('SEO 점수 요약', fontsize=14, fontweight='bold')
+        ax.set_ylim(0, 105)  # 최대값을 100보다 약간 높게 설정하여 텍스트 공간 확보
+        ax.set_ylabel('점수 (100점 만점)', fontsize=12)
+        ax.set_title('SEO 점수 요약', fontsize=14, fontweight='bold')
         
         # 그리드 추가 (가로선만)
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
+        ax.grid(axis='y', linestyle='--', alpha=0.7)
         
         # 여백 조정
-        plt.tight_layout()
-        
-        # 파일로 저장
-        output_file = os.path.join(self.charts_dir, 'scores_chart.png')
-        plt.savefig(output_file, dpi=100, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
         
-        return output_file
+        return fig
     
     def _generate_keyword_chart(self):
         """
         키워드 차트 생성
         
         Returns:
-            str: 차트 파일 경로
+            Figure: 차트 Figure
         """
         # 상위 10개 키워드 가져오기
         keywords = self.report_data['keywords']['global_keywords'][:10]
@@ -197,41 +780,33 @@ class PresentationDesigner:
         kw_counts = [kw['count'] for kw in keywords]
         
         # 그림 크기 설정
-        plt.figure(figsize=(10, 6))
+        fig = self._prepare_figure((10, 6))
+        ax = fig.add_subplot(111)
         
         # 수평 바 차트 생성
-        bars = plt.barh(kw_names[::-1], kw_counts[::-1], color='#4a6fa5')
+        bars = ax.barh(kw_names[::-1], kw_counts[::-1], color='#4a6fa5')
         
         # 바 끝에 값 표시
-        for bar in bars:
-            width = bar.get_width()
-            plt.text(width + 0.5, bar.get_y() + bar.get_height()/2.,
-                    f'{width}',
-                    ha='left', va='center', fontsize=10)
+        ax.bar_label(bars, padding=5, fontsize=10)
         
         # 축 및 제목 설정
-        plt.xlabel('출현 횟수', fontsize=12)
-        plt.title('상위 10개 키워드', fontsize=14, fontweight='bold')
+        ax.set_xlabel('출현 횟수', fontsize=12)
+        ax.set_title('상위 10개 키워드', fontsize=14, fontweight='bold')
         
         # 그리드 추가 (세로선만)
-        plt.grid(axis='x', linestyle='--', alpha=0.7)
+        ax.grid(axis='x', linestyle='--', alpha=0.7)
         
         # 여백 조정
-        plt.tight_layout()
-        
-        # 파일로 저장
-        output_file = os.path.join(self.charts_dir, 'keywords_chart.png')
-        plt.savefig(output_file, dpi=100, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
         
-        return output_file
+        return fig
     
     def _generate_page_depth_chart(self):
         """
         페이지 깊이 분포 차트 생성
         
         Returns:
-            str: 차트 파일 경로
+            Figure: 차트 Figure
         """
         # 사이트 구조 데이터 가져오기
         site_structure = self.report_data['technical_seo'].get('site_structure', {})
@@ -241,52 +816,42 @@ class PresentationDesigner:
             # 예시 데이터 (실제 데이터가 없는 경우)
             depth_distribution = {'0': 1, '1': 5, '2': 10, '3': 7, '4': 3}
         
-        # 데이터 준비
-        depths = [int(d) for d in depth_distribution.keys()]
-        counts = list(depth_distribution.values())
-        
-        # 데이터 정렬
-        sorted_data = sorted(zip(depths, counts))
-        depths = [d[0] for d in sorted_data]
-        counts = [d[1] for d in sorted_data]
+        # 데이터 준비 (깊이 순으로 정렬한 뒤 깊이/페이지 수로 분리)
+        depths, counts = zip(*sorted((int(depth), count) for depth, count in depth_distribution.items()))
         
         # 그림 크기 설정
-        plt.figure(figsize=(8, 5))
+        fig = self._prepare_figure((8, 5))
+        ax = fig.add_subplot(111)
         
         # 선 그래프 생성
-        plt.plot(depths, counts, marker='o', linestyle='-', color='#4a6fa5', linewidth=2, markersize=8)
+        ax.plot(depths, counts, marker='o', linestyle='-', color='#4a6fa5', linewidth=2, markersize=8)
         
         # 점 위에 값 표시
         for i, count in enumerate(counts):
-            plt.text(depths[i], count + 0.5, str(count), ha='center', va='bottom', fontsize=10)
+            ax.text(depths[i], count + 0.5, str(count), ha='center', va='bottom', fontsize=10)
         
         # 축 및 제목 설정
-        plt.xlabel('페이지 깊이', fontsize=12)
-        plt.ylabel('페이지 수', fontsize=12)
-        plt.title('페이지 깊이별 분포', fontsize=14, fontweight='bold')
+        ax.set_xlabel('페이지 깊이', fontsize=12)
+        ax.set_ylabel('페이지 수', fontsize=12)
+        ax.set_title('페이지 깊이별 분포', fontsize=14, fontweight='bold')
         
         # x축 정수 값만 표시
-        plt.xticks(depths)
+        ax.set_xticks(depths)
         
         # 그리드 추가
-        plt.grid(linestyle='--', alpha=0.7)
+        ax.grid(linestyle='--', alpha=0.7)
         
         # 여백 조정
-        plt.tight_layout()
-        
-        # 파일로 저장
-        output_file = os.path.join(self.charts_dir, 'page_depth_chart.png')
-        plt.savefig(output_file, dpi=100, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
         
-        return output_file
+        return fig
     
     def _generate_onpage_scores_chart(self):
         """
         온페이지 SEO 점수 차트 생성
         
         Returns:
-            str: 차트 파일 경로
+            Figure: 차트 Figure
         """
         # 상위 5개 페이지 가져오기
         onpage_results = self.report_data['onpage_seo'][:5]
@@ -306,109 +871,85 @@ class PresentationDesigner:
         scores = [page['score'] for page in onpage_results]
         
         # 그림 크기 설정
-        plt.figure(figsize=(10, 6))
+        fig = self._prepare_figure((10, 6))
+        ax = fig.add_subplot(111)
         
         # 수평 바 차트 생성
-        bars = plt.barh(urls[::-1], scores[::-1], color='#5b8c5a')
+        bars = ax.barh(urls[::-1], scores[::-1], color='#5b8c5a')
         
         # 바 끝에 값 표시
-        for bar in bars:
-            width = bar.get_width()
-            plt.text(width + 1, bar.get_y() + bar.get_height()/2.,
-                    f'{width}',
-                    ha='left', va='center', fontsize=10)
+        ax.bar_label(bars, padding=5, fontsize=10)
         
         # 축 및 제목 설정
-        plt.xlabel('점수 (100점 만점)', fontsize=12)
-        plt.title('상위 5개 페이지 온페이지 SEO 점수', fontsize=14, fontweight='bold')
+        ax.set_xlabel('점수 (100점 만점)', fontsize=12)
+        ax.set_title('상위 5개 페이지 온페이지 SEO 점수', fontsize=14, fontweight='bold')
         
         # x축 범위 설정
-        plt.xlim(0, 105)
+        ax.set_xlim(0, 105)
         
         # 그리드 추가 (세로선만)
-        plt.grid(axis='x', linestyle='--', alpha=0.7)
+        ax.grid(axis='x', linestyle='--', alpha=0.7)
         
         # 여백 조정
-        plt.tight_layout()
-        
-        # 파일로 저장
-        output_file = os.path.join(self.charts_dir, 'onpage_scores_chart.png')
-        plt.savefig(output_file, dpi=100, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
         
-        return output_file
+        return fig
     
     def _generate_technical_scores_chart(self):
         """
         기술적 SEO 카테고리 점수 차트 생성
         
         Returns:
-            str: 차트 파일 경로
+            Figure: 차트 Figure
         """
-        # 기술적 SEO 카테고리 및 점수 (예시 데이터)
-        categories = [
-            'robots.txt',
-            'sitemap.xml',
-            '사이트 구조',
-            'Core Web Vitals',
-            '리다이렉트',
-            '표준 링크',
-            '메타 태그',
-            '구조화된 데이터',
-            '링크',
-            '모바일 친화성',
-            '보안',
-            '페이지 속도'
-        ]
+        # 기술적 SEO 카테고리 (예시 데이터)
+        categories = list(_CATEGORY_KEY_MAP)
         
         # 각 카테고리의 이슈 수를 기반으로 점수 계산 (예시)
-        scores = []
-        for category in categories:
-            category_key = self._get_category_key(category)
-            if category_key in self.report_data['technical_seo']:
-                issues = self.report_data['technical_seo'][category_key].get('issues', [])
-                score = max(0, 100 - len(issues) * 20)  # 이슈당 20점 감점
-            else:
-                score = 50  # 기본값
-            scores.append(score)
+        # 이슈당 20점 감점, 데이터가 없는 카테고리는 기본값 50점
+        # 카테고리가 12개로 고정되어 있어 NumPy/Numba 대신 단일 컴프리헨션으로 계산
+        technical_seo = self.report_data['technical_seo']
+        scores = [
+            max(0, 100 - len(technical_seo[category_key].get('issues', [])) * 20) if category_key in technical_seo else 50
+            for category_key in _CATEGORY_KEY_MAP.values()
+        ]
         
         # 그림 크기 설정
-        plt.figure(figsize=(12, 8))
+        fig = self._prepare_figure((8, 8))
         
         # 레이더 차트 준비
-        angles = np.linspace(0, 2*np.pi, len(categories), endpoint=False).tolist()
-        angles += angles[:1]  # 첫 번째 점을 마지막에 추가하여 폐곡선 만들기
+        # 12개 원소라 NumPy 호출 비용이 계산보다 커서 순수 파이썬으로 계산
+        n = len(categories)
+        angles = [math.tau * i / n for i in range(n)]
+        angles.append(angles[0])  # 첫 번째 점을 마지막에 추가하여 폐곡선 만들기
         
         scores += scores[:1]  # 첫 번째 점을 마지막에 추가하여 폐곡선 만들기
         
         # 레이더 차트 그리기
-        ax = plt.subplot(111, polar=True)
+        ax = fig.add_subplot(111, polar=True)
         ax.plot(angles, scores, 'o-', linewidth=2, color='#4a6fa5')
         ax.fill(angles, scores, alpha=0.25, color='#4a6fa5')
         
         # 축 설정
-        ax.set_thetagrids(np.degrees(angles[:-1]), categories)
+        ax.set_thetagrids([math.degrees(angle) for angle in angles[:-1]], categories)
         ax.set_ylim(0, 100)
         ax.set_yticks([20, 40, 60, 80, 100])
         ax.set_yticklabels(['20', '40', '60', '80', '100'])
         ax.grid(True)
         
         # 제목 설정
-        plt.title('기술적 SEO 카테고리별 점수', fontsize=14, fontweight='bold', y=1.1)
+        ax.set_title('기술적 SEO 카테고리별 점수', fontsize=14, fontweight='bold', y=1.1)
         
         # 여백 조정
-        plt.tight_layout()
-        
-        # 파일로 저장
-        output_file = os.path.join(self.charts_dir, 'technical_scores_chart.png')
-        plt.savefig(output_file, dpi=100, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
         
-        return output_file
+        return fig
     
-    def _shorten_url(self, url, max_length=30):
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _shorten_url(url, max_length=30):
         """
-        URL 단축
+        URL 단축 (같은 URL이 여러 차트/슬라이드에 반복되므로 결과를 캐시)
         
         Args:
             url (str): 원본 URL
@@ -420,15 +961,13 @@ class PresentationDesigner:
         if len(url) <= max_length:
             return url
             
-        # 프로토콜 제거
-        if '://' in url:
-            url = url.split('://')[-1]
-            
-        # 도메인 추출
-        domain = url.split('/')[0]
-        
-        # 경로 추출
-        path = '/'.join(url.split('/')[1:])
+        # 한 번의 파싱으로 도메인과 경로 추출 (프로토콜이 없으면 첫 '/' 기준으로 분리)
+        parts = urlsplit(url)
+        if parts.netloc:
+            domain = parts.netloc
+            path = url[url.index(domain) + len(domain):].removeprefix('/')
+        else:
+            domain, _, path = url.partition('/')
         
         # 경로가 너무 길면 단축
         if len(domain) + len(path) + 1 > max_length:
@@ -437,386 +976,90 @@ class PresentationDesigner:
             
         return domain + '/' + path
     
-    def _get_category_key(self, category):
-        """
-        카테고리 이름을 키로 변환
-        
-        Args:
-            category (str): 카테고리 이름
-            
-        Returns:
-            str: 카테고리 키
-        """
-        mapping = {
-            'robots.txt': 'robots_txt',
-            'sitemap.xml': 'sitemap',
-            '사이트 구조': 'site_structure',
-            'Core Web Vitals': 'core_web_vitals',
-            '리다이렉트': 'redirects',
-            '표준 링크': 'canonical',
-            '메타 태그': 'meta_tags',
-            '구조화된 데이터': 'structured_data',
-            '링크': 'links',
-            '모바일 친화성': 'mobile_friendly',
-            '보안': 'security',
-            '페이지 속도': 'page_speed'
-        }
-        return mapping.get(category, category.lower().replace(' ', '_'))
-    
-    def generate_presentation_html(self, charts, output_file):
+    @staticmethod
+    def _split_recommendations(recommendations):
         """
-        HTML 프레젠테이션 생성
+        권장사항을 우선순위별(높음/중기/장기) 3개씩으로 분할
         
         Args:
-            charts (dict): 차트 파일 경로
-            output_file (str): 출력 파일 경로
+            recommendations (list): 권장사항 목록
             
         Returns:
-            str: 생성된 파일 경로
+            tuple: (높은 우선순위, 중기, 장기) 권장사항 (해당 항목이 없으면 빈 튜플)
         """
-        # 프레젠테이션 데이터
-        presentation_data = self.report_data
-        
-        # HTML 템플릿 생성
-        html_content = self._generate_presentation_html_template(presentation_data, charts)
-        
-        # 파일로 저장
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-            
-        return output_file
+        n = len(recommendations)
+        short_term = recommendations[:3]
+        mid_term = recommendations[3:6] if n > 3 else ()
+        long_term = recommendations[6:9] if n > 6 else ()
+        return short_term, mid_term, long_term
     
-    def _generate_presentation_html_template(self, data, charts):
-        """
-        HTML 프레젠테이션 템플릿 생성
-        
-        Args:
-            data (dict): 프레젠테이션 데이터
-            charts (dict): 차트 파일 경로
-            
-        Returns:
-            str: HTML 템플릿
-        """
-        # 이미지를 base64로 인코딩
-        chart_images = {}
-        for key, path in charts.items():
-            if path and os.path.exists(path):
-                try:
-                    with open(path, 'rb') as f:
-                        image_data = f.read()
-                        base64_data = base64.b64encode(image_data).decode('utf-8')
-                        chart_images[key] = f"data:image/png;base64,{base64_data}"
-                except Exception as e:
-                    print(f"Error encoding chart {key}: {e}")
-                    chart_images[key] = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="  # 1x1 transparent PNG
-            else:
-                print(f"Chart {key} not found, using placeholder")
-                chart_images[key] = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="  # 1x1 transparent PNG
-        
-        # HTML 템플릿
-        html = f"""<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{data.get('title', data.get('website', {}).get('url', 'SEO Audit Report'))}</title>
-    <style>
-        :root {{
-            --primary-color: #4a6fa5;
-            --secondary-color: #5b8c5a;
-            --accent-color: #d98c5f;
-            --text-color: #333;
-            --background-color: #fff;
-            --slide-background: #f9f9f9;
-        }}
-        
-        body {{
-            font-family: 'Noto Sans KR', Arial, sans-serif;
-            line-height: 1.6;
-            color: var(--text-color);
-            background-color: var(--background-color);
-            margin: 0;
-            padding: 0;
-        }}
-        
-        .presentation-container {{
-            max-width: 1000px;
-            margin: 0 auto;
-            padding: 20px;
-        }}
-        
-        .controls {{
-            position: fixed;
-            bottom: 20px;
-            left: 0;
-            right: 0;
-            text-align: center;
-            z-index: 100;
-        }}
-        
-        .controls button {{
-            background-color: var(--primary-color);
-            color: white;
-            border: none;
-            padding: 10px 20px;
-            margin: 0 5px;
-            border-radius: 5px;
-            cursor: pointer;
-            font-size: 16px;
-        }}
-        
-        .controls button:hover {{
-            background-color: #3a5a8c;
-        }}
-        
-        .slide {{
-            display: none;
-            background-color: var(--slide-background);
-            border-radius: 10px;
-            padding: 40px;
-            margin-bottom: 20px;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-            min-height: 500px;
-            position: relative;
-        }}
-        
-        .slide.active {{
-            display: block;
-        }}
-        
-        .slide-number {{
-            position: absolute;
-            bottom: 10px;
-            right: 20px;
-            font-size: 14px;
-            color: #999;
-        }}
-        
-        h1, h2, h3 {{
-            color: var(--primary-color);
-        }}
-        
-        h1 {{
-            font-size: 2.5em;
-            margin-bottom: 20px;
-            border-bottom: 2px solid var(--primary-color);
-            padding-bottom: 10px;
-        }}
-        
-        h2 {{
-            font-size: 2em;
-            margin-top: 0;
-        }}
-        
-        ul, ol {{
-            margin-bottom: 20px;
-        }}
-        
-        li {{
-            margin-bottom: 10px;
-        }}
-        
-        .chart-container {{
-            text-align: center;
-            margin: 20px 0;
-        }}
-        
-        .chart-container img {{
-            max-width: 100%;
-            height: auto;
-            border-radius: 5px;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }}
-        
-        .score-container {{
-            display: flex;
-            justify-content: space-around;
-            margin: 30px 0;
-        }}
-        
-        .score-box {{
-            text-align: center;
-            padding: 20px;
-            border-radius: 10px;
-            width: 25%;
-            color: white;
-        }}
-        
-        .score-box.overall {{
-            background-color: var(--primary-color);
-        }}
-        
-        .score-box.technical {{
-            background-color: var(--secondary-color);
-        }}
-        
-        .score-box.onpage {{
-            background-color: var(--accent-color);
-        }}
-        
-        .score-value {{
-            font-size: 3em;
-            font-weight: bold;
-            margin: 10px 0;
-        }}
-        
-        .issues-container, .recommendations-container {{
-            background-color: white;
-            padding: 20px;
-            border-radius: 5px;
-            margin: 20px 0;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.05);
-        }}
-        
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 20px 0;
-        }}
-        
-        th, td {{
-            border: 1px solid #ddd;
-            padding: 12px;
-            text-align: left;
-        }}
-        
-        th {{
-            background-color: var(--primary-color);
-            color: white;
-        }}
-        
-        tr:nth-child(even) {{
-            background-color: #f2f2f2;
-        }}
-        
-        .download-container {{
-            margin-top: 30px;
-            text-align: center;
-        }}
-        
-        .download-button {{
-            display: inline-block;
-            background-color: var(--primary-color);
-            color: white;
-            padding: 10px 20px;
-            border-radius: 5px;
-            text-decoration: none;
-            margin: 0 10px;
-        }}
-        
-        .download-button:hover {{
-            background-color: #3a5a8c;
-        }}
-        
-        @media print {{
-            .controls, .download-container {{
-                display: none;
-            }}
-            
-            .slide {{
-                display: block;
-                break-after: page;
-                box-shadow: none;
-                min-height: auto;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="presentation-container">
-        <!-- 슬라이드 1: 제목 -->
-        <div class="slide active" id="slide-1">
-            <h1>{data.get('title', f"SEO Audit Report - {data.get('website', {}).get('url', 'Website')}")}</h1>
-            <p><strong>분석 날짜:</strong> {data['date']}</p>
-            <p><strong>웹사이트:</strong> {data['website']['url']}</p>
-            <div class="chart-container">
-                <img src="{chart_images['scores']}" alt="SEO 점수 차트">
-            </div>
-            <div class="slide-number">1 / 10</div>
-        </div>
-        
-        <!-- 슬라이드 2: 개요 -->
-        <div class="slide" id="slide-2">
-            <h2>개요</h2>
-            <p>이 보고서는 {data['website']['url']}의 SEO 상태에 대한 종합적인 분석을 제공합니다.</p>
-            <ul>
-                <li>검색 엔진 최적화(SEO)는 웹사이트의 가시성과 검색 엔진 순위를 향상시키는 과정입니다.</li>
-                <li>이 감사는 기술적 SEO, 온페이지 SEO, 키워드 분석을 포함합니다.</li>
-                <li>분석 날짜: {data['date']}</li>
-            </ul>
-            <div class="score-container">
-                <div class="score-box overall">
-                    <h3>전체 점수</h3>
-                    <div class="score-value">{data['scores']['overall']}</div>
-                    <div>/ 100</div>
-                </div>
-                <div class="score-box technical">
-                    <h3>기술적 SEO</h3>
-                    <div class="score-value">{data['scores']['technical']}</div>
-                    <div>/ 100</div>
-                </div>
-                <div class="score-box onpage">
-                    <h3>온페이지 SEO</h3>
-                    <div class="score-value">{data['scores']['onpage']}</div>
-                    <div>/ 100</div>
-                </div>
-            </div>
-            <div class="slide-number">2 / 10</div>
-        </div>
-        
-        <!-- 슬라이드 3: 주요 이슈 -->
-        <div class="slide" id="slide-3">
-            <h2>주요 이슈</h2>
-            <div class="issues-container">
-                <ul>
-"""
+    def _get_category_key(self, category):
+        """
+        카테고리 이름을 키로 변환
         
-        # 주요 이슈 추가
-        for issue in data['summary']['top_issues'][:5]:
-            html += f"                    <li>{issue}</li>\n"
+        Args:
+            category (str): 카테고리 이름
             
-        html += """                </ul>
-            </div>
-            <div class="chart-container">
-                <img src="{}" alt="기술적 SEO 카테고리별 점수 차트">
-            </div>
-            <div class="slide-number">3 / 10</div>
-        </div>
-        """.format(chart_images['technical_scores'])
+        Returns:
+            str: 카테고리 키
+        """
+        return _CATEGORY_KEY_MAP.get(category, category.lower().replace(' ', '_'))
+    
+    def generate_presentation_html(self, charts, output_file):
+        """
+        HTML 프레젠테이션 생성
         
-        # 슬라이드 4: 개선 권장사항
-        html += """
-        <!-- 슬라이드 4: 개선 권장사항 -->
-        <div class="slide" id="slide-4">
-            <h2>개선 권장사항</h2>
-            <div class="recommendations-container">
-                <ul>
-"""
+        Args:
+            charts (dict): 차트별 PNG 데이터
+            output_file (str): 출력 파일 경로
+            
+        Returns:
+            str: 생성된 파일 경로
+        """
+        # 프레젠테이션 데이터
+        presentation_data = self.report_data
+        
+        # 브라우저용 HTML에만 SVG 차트를 삽입 (SVG는 여기서만 렌더링)
+        chart_svgs = {name: self._render_svg(fig) for name, fig in self.chart_figures.items() if charts.get(name)}
+        html_content = self._generate_presentation_html_template(presentation_data, charts, chart_svgs)
+        self.presentation_html = html_content
+        self.presentation_file = os.path.abspath(output_file)
         
-        # 개선 권장사항 추가
-        for rec in data['summary']['top_recommendations'][:5]:
-            html += f"                    <li>{rec}</li>\n"
+        # WeasyPrint용 HTML은 이미 렌더링된 PNG를 사용 (SVG를 다시 래스터화하지 않음)
+        self.pdf_html = self._generate_presentation_html_template(presentation_data, charts)
+        
+        # 파일로 저장 (UTF-8 인코딩을 한 번에 수행하고 바이너리로 기록)
+        with open(output_file, 'wb') as f:
+            f.write(html_content.encode('utf-8'))
             
-        html += """                </ul>
-            </div>
-            <div class="slide-number">4 / 10</div>
-        </div>
+        return output_file
+    
+    def _generate_presentation_html_template(self, data, charts, chart_svgs=None):
         """
+        HTML 프레젠테이션 템플릿 생성
         
-        # 슬라이드 5: 기술적 SEO 분석
-        html += """
-        <!-- 슬라이드 5: 기술적 SEO 분석 -->
-        <div class="slide" id="slide-5">
-            <h2>기술적 SEO 분석</h2>
-            <p>기술적 SEO는 검색 엔진이 웹사이트를 크롤링하고 색인화하는 방식에 영향을 미치는 요소입니다.</p>
-            <table>
-                <tr>
-                    <th>카테고리</th>
-                    <th>상태</th>
-                </tr>
-"""
+        Args:
+            data (dict): 프레젠테이션 데이터
+            charts (dict): 차트별 PNG 데이터
+            chart_svgs (dict, optional): 차트별 SVG 마크업 (없으면 PNG 이미지 사용)
+            
+        Returns:
+            str: HTML 템플릿
+        """
+        chart_svgs = chart_svgs or {}
+        
+        # SVG가 없는 차트만 PNG를 base64로 인코딩
+        chart_images = {}
+        for key, png_data in charts.items():
+            if chart_svgs.get(key):
+                continue
+            if png_data:
+                chart_images[key] = 'data:image/png;base64,' + binascii.b2a_base64(png_data, newline=False).decode('ascii')
+            else:
+                logger.warning(f"Chart {key} not found, using placeholder")
+                chart_images[key] = _PLACEHOLDER_DATAURI
         
-        # 기술적 SEO 카테고리 상태 추가
+        # 기술적 SEO 카테고리 상태 계산
         categories = [
             {'name': 'robots.txt', 'key': 'robots_txt', 'status_key': 'exists', 'true_text': '존재함', 'false_text': '존재하지 않음'},
             {'name': 'sitemap.xml', 'key': 'sitemap', 'status_key': 'exists', 'true_text': '존재함', 'false_text': '존재하지 않음'},
@@ -826,13 +1069,16 @@ class PresentationDesigner:
             {'name': 'HTTPS', 'key': 'security', 'status_key': 'is_https', 'true_text': '사용 중', 'false_text': '사용하지 않음'}
         ]
         
+        technical_seo = data['technical_seo']
+        technical_rows = []
         for category in categories:
             status = '정보 없음'
             
-            if category['key'] in data['technical_seo']:
+            if category['key'] in technical_seo:
+                category_data = technical_seo[category['key']]
                 if isinstance(category['status_key'], list):
                     # 중첩된 키 처리
-                    value = data['technical_seo'][category['key']]
+                    value = category_data
                     for key in category['status_key']:
                         if key in value:
                             value = value[key]
@@ -840,224 +1086,47 @@ class PresentationDesigner:
                             value = None
                             break
                     status = str(value) if value is not None else '정보 없음'
-                elif category['status_key'] in data['technical_seo'][category['key']]:
-                    value = data['technical_seo'][category['key']][category['status_key']]
+                elif category['status_key'] in category_data:
+                    value = category_data[category['status_key']]
                     if isinstance(value, bool):
                         status = category['true_text'] if value else category['false_text']
                     else:
                         status = category.get('prefix', '') + str(value)
-            
-            html += f"""                <tr>
-                    <td>{category['name']}</td>
-                    <td>{status}</td>
-                </tr>
-"""
-        
-        html += """            </table>
-            <div class="chart-container">
-                <img src="{}" alt="페이지 깊이별 분포 차트">
-            </div>
-            <div class="slide-number">5 / 10</div>
-        </div>
-        """.format(chart_images['page_depth'])
-        
-        # 슬라이드 6: 상위 키워드 분석
-        html += """
-        <!-- 슬라이드 6: 상위 키워드 분석 -->
-        <div class="slide" id="slide-6">
-            <h2>상위 키워드 분석</h2>
-            <p>키워드 분석은 웹사이트의 콘텐츠가 사용자의 검색 의도와 얼마나 잘 일치하는지 보여줍니다.</p>
-            <div class="chart-container">
-                <img src="{}" alt="상위 키워드 차트">
-            </div>
-            <div class="slide-number">6 / 10</div>
-        </div>
-        """.format(chart_images['keywords'])
-        
-        # 슬라이드 7: 상위 페이지
-        html += """
-        <!-- 슬라이드 7: 상위 페이지 -->
-        <div class="slide" id="slide-7">
-            <h2>상위 페이지</h2>
-            <p>다음은 중요도에 따라 순위가 매겨진 상위 페이지입니다.</p>
-            <table>
-                <tr>
-                    <th>순위</th>
-                    <th>URL</th>
-                    <th>점수</th>
-                    <th>깊이</th>
-                    <th>내부 링크 수</th>
-                </tr>
-"""
-        
-        # 상위 페이지 추가
-        for i, page in enumerate(data['ranked_pages'][:5]):
-            html += f"""                <tr>
-                    <td>{i+1}</td>
-                    <td>{self._shorten_url(page['url'])}</td>
-                    <td>{page['score']}</td>
-                    <td>{page['depth']}</td>
-                    <td>{page['inbound_links']}</td>
-                </tr>
-"""
-        
-        html += """            </table>
-            <div class="slide-number">7 / 10</div>
-        </div>
-        """
-        
-        # 슬라이드 8: 온페이지 SEO 분석
-        html += """
-        <!-- 슬라이드 8: 온페이지 SEO 분석 -->
-        <div class="slide" id="slide-8">
-            <h2>온페이지 SEO 분석</h2>
-            <p>온페이지 SEO는 개별 페이지의 콘텐츠와 HTML 소스 코드를 최적화하는 것을 의미합니다.</p>
-            <div class="chart-container">
-                <img src="{}" alt="온페이지 SEO 점수 차트">
-            </div>
-""".format(chart_images['onpage_scores'])
-        
-        # 상위 3개 페이지의 주요 이슈 추가
-        if data['onpage_seo']:
-            html += """            <h3>주요 페이지 이슈</h3>
-            <table>
-                <tr>
-                    <th>페이지</th>
-                    <th>주요 이슈</th>
-                </tr>
-"""
-            
-            for page in data['onpage_seo'][:3]:
-                issues = ', '.join(page['issues'][:2]) if page['issues'] else '이슈 없음'
-                html += f"""                <tr>
-                    <td>{self._shorten_url(page['url'])}</td>
-                    <td>{issues}</td>
-                </tr>
-"""
-            
-            html += """            </table>
-"""
-        
-        html += """            <div class="slide-number">8 / 10</div>
-        </div>
-        """
-        
-        # 슬라이드 9: 다음 단계
-        html += """
-        <!-- 슬라이드 9: 다음 단계 -->
-        <div class="slide" id="slide-9">
-            <h2>다음 단계</h2>
-            <p>다음은 SEO를 개선하기 위한 권장 단계입니다.</p>
-            
-            <h3>우선순위가 높은 작업</h3>
-            <ol>
-"""
-        
-        # 우선순위가 높은 작업 추가
-        for rec in data['summary']['top_recommendations'][:3]:
-            html += f"                <li>{rec}</li>\n"
-            
-        html += """            </ol>
-            
-            <h3>중기 작업</h3>
-            <ol>
-"""
-        
-        # 중기 작업 추가
-        for rec in data['summary']['top_recommendations'][3:6]:
-            html += f"                <li>{rec}</li>\n"
-            
-        html += """            </ol>
-            
-            <h3>장기 작업</h3>
-            <ol>
-"""
-        
-        # 장기 작업 추가
-        for rec in data['summary']['top_recommendations'][6:9]:
-            html += f"                <li>{rec}</li>\n"
-            
-        html += """            </ol>
-            <div class="slide-number">9 / 10</div>
-        </div>
-        """
-        
-        # 슬라이드 10: 감사합니다
-        html += """
-        <!-- 슬라이드 10: 감사합니다 -->
-        <div class="slide" id="slide-10">
-            <h2>감사합니다</h2>
-            <p>이 SEO 감사 보고서가 웹사이트의 검색 엔진 최적화를 개선하는 데 도움이 되기를 바랍니다.</p>
-            <p>질문이 있으시면 언제든지 문의해 주세요.</p>
-            
-            <div class="download-container">
-                <a href="/download/pptx" class="download-button">PPTX 다운로드</a>
-                <a href="/download/pdf" class="download-button">PDF 다운로드</a>
-            </div>
-            <div class="slide-number">10 / 10</div>
-        </div>
-    </div>
-    
-    <div class="controls">
-        <button id="prev-btn">이전</button>
-        <button id="next-btn">다음</button>
-    </div>
-    
-    <script>
-        // 슬라이드 제어
-        const slides = document.querySelectorAll('.slide');
-        let currentSlide = 0;
-        
-        function showSlide(index) {
-            slides.forEach(slide => slide.classList.remove('active'));
-            slides[index].classList.add('active');
-            currentSlide = index;
-            
-            // 버튼 상태 업데이트
-            document.getElementById('prev-btn').disabled = currentSlide === 0;
-            document.getElementById('next-btn').disabled = currentSlide === slides.length - 1;
-        }
-        
-        document.getElementById('prev-btn').addEventListener('click', () => {
-            if (currentSlide > 0) {
-                showSlide(currentSlide - 1);
-            }
-        });
-        
-        document.getElementById('next-btn').addEventListener('click', () => {
-            if (currentSlide < slides.length - 1) {
-                showSlide(currentSlide + 1);
-            }
-        });
-        
-        // 키보드 제어
-        document.addEventListener('keydown', (e) => {
-            if (e.key === 'ArrowLeft') {
-                if (currentSlide > 0) {
-                    showSlide(currentSlide - 1);
-                }
-            } else if (e.key === 'ArrowRight') {
-                if (currentSlide < slides.length - 1) {
-                    showSlide(currentSlide + 1);
-                }
-            }
-        });
-        
-        // 초기 상태 설정
-        showSlide(0);
-    </script>
-</body>
-</html>
-"""
-        
-        return html
+                        
+            technical_rows.append((category['name'], status))
+        
+        # 반복해서 참조하는 값은 한 번만 조회
+        summary = data['summary']
+        website_url = data.get('website', {}).get('url')
+        short_term, mid_term, long_term = self._split_recommendations(summary['top_recommendations'])
+        
+        # 컴파일된 템플릿에 데이터만 채워 렌더링
+        return _PRESENTATION_TEMPLATE.render(
+            css=_PRESENTATION_CSS,
+            controls_js=_CONTROLS_JS,
+            page_title=data.get('title', website_url or 'SEO Audit Report'),
+            heading=data.get('title', f"SEO Audit Report - {website_url or 'Website'}"),
+            data=data,
+            date=data['date'],
+            website_url=data['website']['url'],
+            scores=data['scores'],
+            chart_images=chart_images,
+            chart_svgs=chart_svgs,
+            top_issues=summary['top_issues'],
+            top_recommendations=summary['top_recommendations'],
+            technical_rows=technical_rows,
+            short_term=short_term,
+            mid_term=mid_term,
+            long_term=long_term,
+            shorten_url=self._shorten_url
+        )
     
     def generate_pptx(self, charts, output_file):
         """
         PPTX 프레젠테이션 생성
         
         Args:
-            charts (dict): 차트 파일 경로
+            charts (dict): 차트별 PNG 데이터
             output_file (str): 출력 파일 경로
             
         Returns:
@@ -1066,276 +1135,245 @@ class PresentationDesigner:
         # 프레젠테이션 생성
         prs = Presentation()
         
+        # 슬라이드 레이아웃은 한 번만 조회하여 재사용
+        title_layout = prs.slide_layouts[0]    # 제목 슬라이드
+        content_layout = prs.slide_layouts[1]  # 제목 및 내용 슬라이드
+        
+        # 차트 위치와 크기 (left, top, width, height)도 한 번만 계산
+        slide_width, slide_height = prs.slide_width, prs.slide_height
+        chart_large = (int(slide_width * 0.1), int(slide_height * 0.3), int(slide_width * 0.8), int(slide_height * 0.6))
+        chart_small = (int(slide_width * 0.1), int(slide_height * 0.5), int(slide_width * 0.8), int(slide_height * 0.4))
+        
+        # 생성에 성공한 차트만 한 번에 골라내어 슬라이드에서는 키 존재 여부만 확인
+        valid_charts = {key: png_data for key, png_data in charts.items() if png_data}
+        
+        # 제목 슬라이드 문구는 보고서 데이터에서 한 번만 구성
+        report_data = self.report_data
+        title_text = report_data.get('title', f"SEO Audit Report - {report_data.get('website', {}).get('url', 'Website')}")
+        subtitle_text = f"분석 날짜: {report_data['date']}\n웹사이트: {report_data['website']['url']}"
+        
         # 슬라이드 추가
-        self._add_title_slide(prs)
-        self._add_overview_slide(prs)
-        self._add_issues_slide(prs)
-        self._add_recommendations_slide(prs)
-        self._add_technical_seo_slide(prs, charts)
-        self._add_keywords_slide(prs, charts)
-        self._add_top_pages_slide(prs)
-        self._add_onpage_seo_slide(prs, charts)
-        self._add_next_steps_slide(prs)
-        self._add_thank_you_slide(prs)
+        self._add_title_slide(prs, title_layout, title_text, subtitle_text)
+        self._add_overview_slide(prs, content_layout)
+        self._add_issues_slide(prs, content_layout)
+        self._add_recommendations_slide(prs, content_layout)
+        self._add_technical_seo_slide(prs, content_layout, valid_charts, chart_small)
+        self._add_keywords_slide(prs, content_layout, valid_charts, chart_large)
+        self._add_top_pages_slide(prs, content_layout)
+        self._add_onpage_seo_slide(prs, content_layout, valid_charts, chart_large)
+        self._add_next_steps_slide(prs, content_layout)
+        self._add_thank_you_slide(prs, title_layout)
         
         # 파일로 저장
         prs.save(output_file)
         
         return output_file
     
-    def _add_title_slide(self, prs):
+    def _add_content_slide(self, prs, layout, title_text, body_text, png_data=None, rect=None, chart_name=None):
         """
-        제목 슬라이드 추가
+        제목과 본문(부제목)으로 구성된 슬라이드 추가 (차트가 있으면 함께 배치)
         
         Args:
             prs (Presentation): 프레젠테이션 객체
+            layout (SlideLayout): 슬라이드 레이아웃
+            title_text (str): 제목
+            body_text (str): 본문 또는 부제목
+            png_data (bytes, optional): 차트 PNG 데이터
+            rect (tuple, optional): 차트 위치와 크기 (left, top, width, height)
+            chart_name (str, optional): 오류 메시지에 표시할 차트 이름
+            
+        Returns:
+            Slide: 추가된 슬라이드
         """
-        # 제목 슬라이드 레이아웃 사용
-        slide = prs.slides.add_slide(prs.slide_layouts[0])
+        slide = prs.slides.add_slide(layout)
+        shapes = slide.shapes
         
-        # 제목 및 부제목 설정
-        title = slide.shapes.title
-        subtitle = slide.placeholders[1]
+        # 제목 및 내용 설정
+        shapes.title.text = title_text
+        slide.placeholders[1].text_frame.text = body_text
         
-        title.text = self.report_data.get('title', f"SEO Audit Report - {self.report_data.get('website', {}).get('url', 'Website')}")
-        subtitle.text = f"분석 날짜: {self.report_data['date']}\n웹사이트: {self.report_data['website']['url']}"
+        # 차트 추가
+        if png_data:
+            try:
+                shapes.add_picture(io.BytesIO(png_data), *rect)
+            except Exception:
+                logger.exception(f"Error adding {chart_name} chart to PPTX")
+                
+        return slide
     
-    def _add_overview_slide(self, prs):
+    def _add_title_slide(self, prs, layout, title_text, subtitle_text):
         """
-        개요 슬라이드 추가
+        제목 슬라이드 추가
         
         Args:
             prs (Presentation): 프레젠테이션 객체
+            layout (SlideLayout): 슬라이드 레이아웃
+            title_text (str): 보고서 제목
+            subtitle_text (str): 분석 날짜와 웹사이트를 담은 부제목
+        """
+        self._add_content_slide(prs, layout, title_text, subtitle_text)
+    
+    def _add_overview_slide(self, prs, layout):
         """
-        # 제목 및 내용 슬라이드 레이아웃 사용
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        개요 슬라이드 추가
         
-        # 제목 및 내용 설정
-        title = slide.shapes.title
-        content = slide.placeholders[1]
+        Args:
+            prs (Presentation): 프레젠테이션 객체
+            layout (SlideLayout): 슬라이드 레이아웃
+        """
+        report_data = self.report_data
+        scores = report_data['scores']
         
-        title.text = "개요"
-        content.text = f"""이 보고서는 {self.report_data['website']['url']}의 SEO 상태에 대한 종합적인 분석을 제공합니다.
+        title_text = "개요"
+        body_text = f"""이 보고서는 {report_data['website']['url']}의 SEO 상태에 대한 종합적인 분석을 제공합니다.
         
 • 검색 엔진 최적화(SEO)는 웹사이트의 가시성과 검색 엔진 순위를 향상시키는 과정입니다.
 • 이 감사는 기술적 SEO, 온페이지 SEO, 키워드 분석을 포함합니다.
-• 분석 날짜: {self.report_data['date']}
+• 분석 날짜: {report_data['date']}
 
-전체 점수: {self.report_data['scores']['overall']}/100
-기술적 SEO 점수: {self.report_data['scores']['technical']}/100
-온페이지 SEO 점수: {self.report_data['scores']['onpage']}/100"""
+전체 점수: {scores['overall']}/100
+기술적 SEO 점수: {scores['technical']}/100
+온페이지 SEO 점수: {scores['onpage']}/100"""
+        
+        self._add_content_slide(prs, layout, title_text, body_text)
     
-    def _add_issues_slide(self, prs):
+    def _add_issues_slide(self, prs, layout):
         """
         주요 이슈 슬라이드 추가
         
         Args:
             prs (Presentation): 프레젠테이션 객체
+            layout (SlideLayout): 슬라이드 레이아웃
         """
-        # 제목 및 내용 슬라이드 레이아웃 사용
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        
-        # 제목 및 내용 설정
-        title = slide.shapes.title
-        content = slide.placeholders[1]
+        title_text = "주요 이슈"
+        body_text = ''.join(f"• {issue}\n" for issue in self.report_data['summary']['top_issues'][:5])
         
-        title.text = "주요 이슈"
-        
-        issues_text = ""
-        for issue in self.report_data['summary']['top_issues'][:5]:
-            issues_text += f"• {issue}\n"
-            
-        content.text = issues_text
+        self._add_content_slide(prs, layout, title_text, body_text)
     
-    def _add_recommendations_slide(self, prs):
+    def _add_recommendations_slide(self, prs, layout):
         """
         개선 권장사항 슬라이드 추가
         
         Args:
             prs (Presentation): 프레젠테이션 객체
+            layout (SlideLayout): 슬라이드 레이아웃
         """
-        # 제목 및 내용 슬라이드 레이아웃 사용
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        
-        # 제목 및 내용 설정
-        title = slide.shapes.title
-        content = slide.placeholders[1]
+        title_text = "개선 권장사항"
+        body_text = ''.join(f"• {rec}\n" for rec in self.report_data['summary']['top_recommendations'][:5])
         
-        title.text = "개선 권장사항"
-        
-        recommendations_text = ""
-        for rec in self.report_data['summary']['top_recommendations'][:5]:
-            recommendations_text += f"• {rec}\n"
-            
-        content.text = recommendations_text
+        self._add_content_slide(prs, layout, title_text, body_text)
     
-    def _add_technical_seo_slide(self, prs, charts):
+    def _add_technical_seo_slide(self, prs, layout, charts, rect):
         """
         기술적 SEO 분석 슬라이드 추가
         
         Args:
             prs (Presentation): 프레젠테이션 객체
-            charts (dict): 차트 파일 경로
+            layout (SlideLayout): 슬라이드 레이아웃
+            charts (dict): 생성에 성공한 차트별 PNG 데이터
+            rect (tuple): 차트 위치와 크기 (left, top, width, height)
         """
-        # 제목 및 내용 슬라이드 레이아웃 사용
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        
-        # 제목 및 내용 설정
-        title = slide.shapes.title
-        content = slide.placeholders[1]
-        
-        title.text = "기술적 SEO 분석"
-        content.text = """기술적 SEO는 검색 엔진이 웹사이트를 크롤링하고 색인화하는 방식에 영향을 미치는 요소입니다.
+        title_text = "기술적 SEO 분석"
+        body_text = """기술적 SEO는 검색 엔진이 웹사이트를 크롤링하고 색인화하는 방식에 영향을 미치는 요소입니다.
 
 • robots.txt: 검색 엔진 크롤러에게 웹사이트의 어떤 부분을 크롤링해야 하는지 알려주는 파일
 • sitemap.xml: 웹사이트의 모든 페이지 목록을 제공하여 검색 엔진이 콘텐츠를 더 효율적으로 크롤링할 수 있도록 돕는 파일
 • Core Web Vitals: 사용자 경험을 측정하는 Google의 지표 (LCP, FID, CLS)
 • 모바일 친화성: 웹사이트가 모바일 기기에서 얼마나 잘 작동하는지 측정"""
         
-        # 차트 추가
-        if 'technical_scores' in charts and charts['technical_scores'] and os.path.exists(charts['technical_scores']):
-            try:
-                left = prs.slide_width * 0.1
-                top = prs.slide_height * 0.5
-                width = prs.slide_width * 0.8
-                height = prs.slide_height * 0.4
-                
-                slide.shapes.add_picture(charts['technical_scores'], left, top, width, height)
-            except Exception as e:
-                print(f"Error adding technical scores chart to PPTX: {e}")
+        self._add_content_slide(prs, layout, title_text, body_text, charts.get('technical_scores'), rect, 'technical scores')
     
-    def _add_keywords_slide(self, prs, charts):
+    def _add_keywords_slide(self, prs, layout, charts, rect):
         """
         상위 키워드 분석 슬라이드 추가
         
         Args:
             prs (Presentation): 프레젠테이션 객체
-            charts (dict): 차트 파일 경로
+            layout (SlideLayout): 슬라이드 레이아웃
+            charts (dict): 생성에 성공한 차트별 PNG 데이터
+            rect (tuple): 차트 위치와 크기 (left, top, width, height)
         """
-        # 제목 및 내용 슬라이드 레이아웃 사용
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        title_text = "상위 키워드 분석"
+        body_text = "키워드 분석은 웹사이트의 콘텐츠가 사용자의 검색 의도와 얼마나 잘 일치하는지 보여줍니다."
         
-        # 제목 및 내용 설정
-        title = slide.shapes.title
-        content = slide.placeholders[1]
-        
-        title.text = "상위 키워드 분석"
-        content.text = "키워드 분석은 웹사이트의 콘텐츠가 사용자의 검색 의도와 얼마나 잘 일치하는지 보여줍니다."
-        
-        # 차트 추가
-        if 'keywords' in charts and charts['keywords'] and os.path.exists(charts['keywords']):
-            try:
-                left = prs.slide_width * 0.1
-                top = prs.slide_height * 0.3
-                width = prs.slide_width * 0.8
-                height = prs.slide_height * 0.6
-                
-                slide.shapes.add_picture(charts['keywords'], left, top, width, height)
-            except Exception as e:
-                print(f"Error adding keywords chart to PPTX: {e}")
+        self._add_content_slide(prs, layout, title_text, body_text, charts.get('keywords'), rect, 'keywords')
     
-    def _add_top_pages_slide(self, prs):
+    def _add_top_pages_slide(self, prs, layout):
         """
         상위 페이지 슬라이드 추가
         
         Args:
             prs (Presentation): 프레젠테이션 객체
+            layout (SlideLayout): 슬라이드 레이아웃
         """
-        # 제목 및 내용 슬라이드 레이아웃 사용
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        
-        # 제목 및 내용 설정
-        title = slide.shapes.title
-        content = slide.placeholders[1]
+        title_text = "상위 페이지"
         
-        title.text = "상위 페이지"
-        
-        pages_text = "다음은 중요도에 따라 순위가 매겨진 상위 페이지입니다.\n\n"
+        # 본문 조각을 리스트에 모은 뒤 한 번에 결합
+        parts = ["다음은 중요도에 따라 순위가 매겨진 상위 페이지입니다.\n\n"]
         
         for i, page in enumerate(self.report_data['ranked_pages'][:5]):
-            pages_text += f"{i+1}. {self._shorten_url(page['url'])}\n"
-            pages_text += f"   점수: {page['score']}, 깊이: {page['depth']}, 내부 링크 수: {page['inbound_links']}\n\n"
+            parts.append(f"{i+1}. {self._shorten_url(page['url'])}\n")
+            parts.append(f"   점수: {page['score']}, 깊이: {page['depth']}, 내부 링크 수: {page['inbound_links']}\n\n")
             
-        content.text = pages_text
+        body_text = ''.join(parts)
+        
+        self._add_content_slide(prs, layout, title_text, body_text)
     
-    def _add_onpage_seo_slide(self, prs, charts):
+    def _add_onpage_seo_slide(self, prs, layout, charts, rect):
         """
         온페이지 SEO 분석 슬라이드 추가
         
         Args:
             prs (Presentation): 프레젠테이션 객체
-            charts (dict): 차트 파일 경로
+            layout (SlideLayout): 슬라이드 레이아웃
+            charts (dict): 생성에 성공한 차트별 PNG 데이터
+            rect (tuple): 차트 위치와 크기 (left, top, width, height)
         """
-        # 제목 및 내용 슬라이드 레이아웃 사용
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        
-        # 제목 및 내용 설정
-        title = slide.shapes.title
-        content = slide.placeholders[1]
+        title_text = "온페이지 SEO 분석"
+        body_text = "온페이지 SEO는 개별 페이지의 콘텐츠와 HTML 소스 코드를 최적화하는 것을 의미합니다."
         
-        title.text = "온페이지 SEO 분석"
-        content.text = "온페이지 SEO는 개별 페이지의 콘텐츠와 HTML 소스 코드를 최적화하는 것을 의미합니다."
-        
-        # 차트 추가
-        if 'onpage_scores' in charts and charts['onpage_scores'] and os.path.exists(charts['onpage_scores']):
-            try:
-                left = prs.slide_width * 0.1
-                top = prs.slide_height * 0.3
-                width = prs.slide_width * 0.8
-                height = prs.slide_height * 0.6
-                
-                slide.shapes.add_picture(charts['onpage_scores'], left, top, width, height)
-            except Exception as e:
-                print(f"Error adding onpage scores chart to PPTX: {e}")
+        self._add_content_slide(prs, layout, title_text, body_text, charts.get('onpage_scores'), rect, 'onpage scores')
     
-    def _add_next_steps_slide(self, prs):
+    def _add_next_steps_slide(self, prs, layout):
         """
         다음 단계 슬라이드 추가
         
         Args:
             prs (Presentation): 프레젠테이션 객체
+            layout (SlideLayout): 슬라이드 레이아웃
         """
-        # 제목 및 내용 슬라이드 레이아웃 사용
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        title_text = "다음 단계"
         
-        # 제목 및 내용 설정
-        title = slide.shapes.title
-        content = slide.placeholders[1]
-        
-        title.text = "다음 단계"
+        short_term, mid_term, long_term = self._split_recommendations(self.report_data['summary']['top_recommendations'])
         
-        steps_text = "다음은 SEO를 개선하기 위한 권장 단계입니다.\n\n"
+        # 본문 조각을 리스트에 모은 뒤 한 번에 결합
+        parts = ["다음은 SEO를 개선하기 위한 권장 단계입니다.\n\n"]
         
-        steps_text += "우선순위가 높은 작업:\n"
-        for i, rec in enumerate(self.report_data['summary']['top_recommendations'][:3]):
-            steps_text += f"{i+1}. {rec}\n"
+        parts.append("우선순위가 높은 작업:\n")
+        parts.extend(f"{i+1}. {rec}\n" for i, rec in enumerate(short_term))
             
-        steps_text += "\n중기 작업:\n"
-        for i, rec in enumerate(self.report_data['summary']['top_recommendations'][3:6]):
-            steps_text += f"{i+1}. {rec}\n"
+        parts.append("\n중기 작업:\n")
+        parts.extend(f"{i+1}. {rec}\n" for i, rec in enumerate(mid_term))
             
-        steps_text += "\n장기 작업:\n"
-        for i, rec in enumerate(self.report_data['summary']['top_recommendations'][6:9]):
-            steps_text += f"{i+1}. {rec}\n"
+        parts.append("\n장기 작업:\n")
+        parts.extend(f"{i+1}. {rec}\n" for i, rec in enumerate(long_term))
             
-        content.text = steps_text
+        body_text = ''.join(parts)
+        
+        self._add_content_slide(prs, layout, title_text, body_text)
     
-    def _add_thank_you_slide(self, prs):
+    def _add_thank_you_slide(self, prs, layout):
         """
         감사합니다 슬라이드 추가
         
         Args:
             prs (Presentation): 프레젠테이션 객체
+            layout (SlideLayout): 슬라이드 레이아웃
         """
-        # 제목 슬라이드 레이아웃 사용
-        slide = prs.slides.add_slide(prs.slide_layouts[0])
-        
-        # 제목 및 부제목 설정
-        title = slide.shapes.title
-        subtitle = slide.placeholders[1]
+        title_text = "감사합니다"
+        body_text = "이 SEO 감사 보고서가 웹사이트의 검색 엔진 최적화를 개선하는 데 도움이 되기를 바랍니다.\n\n질문이 있으시면 언제든지 문의해 주세요."
         
-        title.text = "감사합니다"
-        subtitle.text = "이 SEO 감사 보고서가 웹사이트의 검색 엔진 최적화를 개선하는 데 도움이 되기를 바랍니다.\n\n질문이 있으시면 언제든지 문의해 주세요."
+        self._add_content_slide(prs, layout, title_text, body_text)
     
     def generate_pdf(self, html_file, output_file):
         """
@@ -1348,13 +1386,64 @@ class PresentationDesigner:
         Returns:
             str: 생성된 파일 경로
         """
-        if WEASYPRINT_AVAILABLE:
-            # HTML을 PDF로 변환
-            HTML(filename=html_file).write_pdf(output_file)
-        else:
-            # WeasyPrint가 없으면 placeholder PDF 생성
-            print("WeasyPrint not available, creating placeholder PDF")
-            html_obj = HTML()
-            html_obj.write_pdf(output_file)
+        base_url = os.path.dirname(os.path.abspath(html_file))
         
-        return output_file
+        # 이 디자이너가 생성한 HTML이면 PNG 차트를 사용하는 PDF용 HTML로 변환
+        if self.pdf_html is not None and os.path.abspath(html_file) == self.presentation_file:
+            return self.generate_pdf_from_string(self.pdf_html, output_file, base_url)
+            
+        with open(html_file, encoding='utf-8') as f:
+            html_str = f.read()
+            
+        return self.generate_pdf_from_string(html_str, output_file, base_url)
+    
+    def generate_pdf_from_string(self, html_str, output_file, base_url=None):
+        """
+        HTML 문자열에서 바로 PDF 프레젠테이션 생성 (HTML 파일을 다시 읽지 않음)
+        
+        Args:
+            html_str (str): HTML 문자열
+            output_file (str): 출력 파일 경로
+            base_url (str, optional): 상대 경로 기준 URL
+            
+        Returns:
+            str: 생성된 파일 경로
+        """
+        return render_pdf(html_str, output_file, base_url)
+
+def render_pptx(report_data, charts, output_file):
+    """
+    프로세스 풀 워커용 PPTX 생성 (디자이너 객체 대신 보고서 데이터와 차트 PNG만 전달받음)
+    
+    Args:
+        report_data (dict): 보고서 데이터
+        charts (dict): 차트별 PNG 데이터
+        output_file (str): 출력 파일 경로
+        
+    Returns:
+        str: 생성된 파일 경로
+    """
+    return PresentationDesigner(report_data).generate_pptx(charts, output_file)
+
+def render_pdf(html_str, output_file, base_url=None):
+    """
+    HTML 문자열로 PDF 생성 (프로세스 풀 워커에는 HTML 문자열만 전달됨)
+    
+    Args:
+        html_str (str): HTML 문자열
+        output_file (str): 출력 파일 경로
+        base_url (str, optional): 상대 경로 기준 URL
+        
+    Returns:
+        str: 생성된 파일 경로
+    """
+    if WEASYPRINT_AVAILABLE:
+        # HTML을 PDF로 변환
+        HTML(string=html_str, base_url=base_url).write_pdf(output_file)
+    else:
+        # WeasyPrint가 없으면 HTML 객체 없이 placeholder PDF를 바로 기록
+        logger.warning("WeasyPrint not available, creating placeholder PDF")
+        with open(output_file, 'wb') as f:
+            f.write(_PLACEHOLDER_PDF)
+    
+    return output_file
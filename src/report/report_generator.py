@@ -1,9 +1,200 @@
-import json
+import gzip
+import heapq
+import orjson
 import os
 import re
+import jinja2
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from importlib.resources import files
+from itertools import repeat
+from pathlib import Path
+from urllib.parse import urlsplit
 from src.models.seo_data import db, Website, Page, Keyword, Link, TechnicalSEO
 
+# 보고서 템플릿 (모듈 로드 시 한 번만 컴파일하고 호출마다 데이터만 채움, HTML은 자동 이스케이프)
+_REPORT_ENV = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')),
+    autoescape=jinja2.select_autoescape(['html.j2']),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True,
+    auto_reload=False
+)
+_MARKDOWN_TEMPLATE = _REPORT_ENV.get_template('seo_report.md.j2')
+_HTML_TEMPLATE = _REPORT_ENV.get_template('seo_report.html.j2')
+
+# HTML 보고서의 정적 머리(스타일 포함)와 꼬리(용어 설명 포함) (동적 본문과 분리해 인코딩된 상수로 재사용)
+_HTML_HEAD = files('src.report').joinpath('templates', 'seo_report_head.html').read_bytes()
+_HTML_FOOT = files('src.report').joinpath('templates', 'seo_report_foot.html').read_bytes()
+
+
+def _write_json(output_file, data):
+    """
+    데이터를 들여쓰기된 JSON 파일로 저장
+    
+    Args:
+        output_file (Path): 출력 파일 경로
+        data (dict): 저장할 데이터
+    """
+    output_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+
+
+def _score_exists_issues(result):
+    """
+    존재 여부와 이슈 수로 점수 계산 (robots.txt, sitemap)
+    
+    Args:
+        result (dict): 카테고리 검사 결과
+        
+    Returns:
+        float: 카테고리 점수
+    """
+    return 100 - (len(result['issues']) * 20) if result['exists'] else 0
+
+
+def _score_issues(result):
+    """
+    이슈 수로 점수 계산 (이슈 하나당 20점 감점)
+    
+    Args:
+        result (dict): 카테고리 검사 결과
+        
+    Returns:
+        float: 카테고리 점수
+    """
+    return 100 - (len(result['issues']) * 20)
+
+
+# Core Web Vitals (지표, 등급)별 점수 (그 밖의 등급은 0점)
+_CWV_METRICS = ('LCP', 'FID', 'CLS')
+_CWV_POINTS = {
+    ('LCP', 'good'): 33,
+    ('LCP', 'needs improvement'): 16,
+    ('FID', 'good'): 33,
+    ('FID', 'needs improvement'): 16,
+    ('CLS', 'good'): 34,
+    ('CLS', 'needs improvement'): 17
+}
+
+
+def _score_core_web_vitals(cwv):
+    """
+    Core Web Vitals 등급으로 점수 계산
+    
+    Args:
+        cwv (dict): Core Web Vitals 검사 결과
+        
+    Returns:
+        float: 카테고리 점수
+    """
+    return sum(
+        _CWV_POINTS.get((metric, cwv[metric].get('rating')), 0)
+        for metric in _CWV_METRICS
+        if isinstance(cwv.get(metric), dict)
+    )
+
+def _page_ratio(result, key):
+    """
+    전체 페이지 대비 특정 페이지 수의 비율(%) 계산
+    
+    Args:
+        result (dict): 카테고리 검사 결과
+        key (str): 페이지 수 키
+        
+    Returns:
+        float: 비율(%), 계산할 수 없으면 None
+    """
+    if key in result and result.get('total_pages', 0) > 0:
+        return (result[key] / result['total_pages']) * 100
+    return None
+
+
+def _score_canonical(result):
+    """
+    canonical 태그가 있는 페이지 비율로 점수 계산
+    
+    Args:
+        result (dict): canonical 검사 결과
+        
+    Returns:
+        float: 카테고리 점수
+    """
+    ratio = _page_ratio(result, 'pages_with_canonical')
+    return ratio if ratio is not None else 0
+
+
+def _score_meta_tags(result):
+    """
+    메타 태그 이슈가 있는 페이지 비율로 점수 계산
+    
+    Args:
+        result (dict): 메타 태그 검사 결과
+        
+    Returns:
+        float: 카테고리 점수
+    """
+    ratio = _page_ratio(result, 'pages_with_issues')
+    return 100 - ratio if ratio is not None else 0
+
+
+def _score_structured_data(result):
+    """
+    구조화된 데이터가 있는 페이지 비율로 점수 계산
+    
+    Args:
+        result (dict): 구조화된 데이터 검사 결과
+        
+    Returns:
+        float: 카테고리 점수
+    """
+    ratio = _page_ratio(result, 'pages_with_schema')
+    return ratio if ratio is not None else 0
+
+
+def _score_security(result):
+    """
+    HTTPS 및 HSTS 적용 여부로 점수 계산
+    
+    Args:
+        result (dict): 보안 검사 결과
+        
+    Returns:
+        float: 카테고리 점수
+    """
+    return (50 if result['is_https'] else 0) + (50 if result['has_hsts'] else 0)
+
+
+def _joined_length(item):
+    """
+    (접두어, 본문) 튜플을 결합했을 때의 문자열 길이 계산
+    
+    Args:
+        item (tuple): (접두어, 본문) 튜플
+        
+    Returns:
+        int: 결합된 문자열 길이
+    """
+    return len(item[0]) + len(item[1])
+
+
+# 기술적 SEO 카테고리별 (키, 가중치, 점수 함수) 목록 (가중 평균 계산 순서 유지)
+_TECHNICAL_SCORERS = (
+    ('robots_txt', 0.05, _score_exists_issues),
+    ('sitemap', 0.05, _score_exists_issues),
+    ('site_structure', 0.1, _score_issues),
+    ('core_web_vitals', 0.2, _score_core_web_vitals),
+    ('redirects', 0.05, _score_issues),
+    ('canonical', 0.05, _score_canonical),
+    ('meta_tags', 0.15, _score_meta_tags),
+    ('structured_data', 0.1, _score_structured_data),
+    ('links', 0.1, _score_issues),
+    ('mobile_friendly', 0.1, lambda result: 100 if result['is_mobile_friendly'] else 0),
+    ('security', 0.05, _score_security),
+    ('page_speed', 0.1, lambda result: (result['mobile_score'] + result['desktop_score']) / 2)
+)
+
 class ReportGenerator:
     """
     SEO 분석 결과를 바탕으로 종합 보고서를 생성하는 클래스
@@ -18,7 +209,7 @@ class ReportGenerator:
         """
         self.db = db_instance
         
-    def generate_report(self, website_id, technical_results, ranked_pages, onpage_results, output_dir):
+    def generate_report(self, website_id, technical_results, ranked_pages, onpage_results, output_dir, compress=True):
         """
         종합 SEO 보고서 생성
         
@@ -28,6 +219,7 @@ class ReportGenerator:
             ranked_pages (list): 순위가 매겨진 페이지 목록
             onpage_results (list): 온페이지 SEO 분석 결과
             output_dir (str): 출력 디렉토리
+            compress (bool): HTML 보고서의 gzip 압축본(.html.gz)도 함께 생성할지 여부
             
         Returns:
             dict: 생성된 보고서 파일 경로
@@ -37,36 +229,48 @@ class ReportGenerator:
             raise ValueError(f"ID가 {website_id}인 웹사이트를 찾을 수 없습니다.")
             
         # 출력 디렉토리 생성
-        os.makedirs(output_dir, exist_ok=True)
+        out_dir = Path(output_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
         
         # 보고서 데이터 준비
         report_data = self._prepare_report_data(website, technical_results, ranked_pages, onpage_results)
         
-        # JSON 형식으로 보고서 데이터 저장
-        json_file = os.path.join(output_dir, 'seo_report_data.json')
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, ensure_ascii=False, indent=2)
-            
-        # 마크다운 형식으로 보고서 생성
-        md_file = os.path.join(output_dir, 'seo_report.md')
-        self._generate_markdown_report(report_data, md_file)
-        
-        # HTML 형식으로 보고서 생성
-        html_file = os.path.join(output_dir, 'seo_report.html')
-        self._generate_html_report(report_data, html_file)
-        
         # 프레젠테이션 데이터 생성
         presentation_data = self._prepare_presentation_data(report_data)
-        presentation_file = os.path.join(output_dir, 'presentation_data.json')
-        with open(presentation_file, 'w', encoding='utf-8') as f:
-            json.dump(presentation_data, f, ensure_ascii=False, indent=2)
+        
+        json_file = out_dir / 'seo_report_data.json'
+        md_file = out_dir / 'seo_report.md'
+        html_file = out_dir / 'seo_report.html'
+        presentation_file = out_dir / 'presentation_data.json'
+        
+        # 서로 독립적인 파일 기록은 스레드에서 동시에 수행
+        # (orjson 직렬화, 압축, 파일 쓰기는 GIL을 해제하는 C/Rust 코드에서 수행됨)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                # JSON 형식으로 보고서 데이터 저장
+                executor.submit(_write_json, json_file, report_data),
+                # 마크다운 형식으로 보고서 생성
+                executor.submit(self._generate_markdown_report, report_data, md_file),
+                # HTML 형식으로 보고서 생성
+                executor.submit(self._generate_html_report, report_data, html_file, compress=compress),
+                # 프레젠테이션 데이터 저장
+                executor.submit(_write_json, presentation_file, presentation_data)
+            ]
             
-        return {
-            'json': json_file,
-            'markdown': md_file,
-            'html': html_file,
-            'presentation_data': presentation_file
+        # 기록 중 발생한 예외를 호출자에게 전달
+        for future in futures:
+            future.result()
+            
+        report_files = {
+            'json': str(json_file),
+            'markdown': str(md_file),
+            'html': str(html_file),
+            'presentation_data': str(presentation_file)
         }
+        if compress:
+            report_files['html_gz'] = f"{html_file}.gz"
+            
+        return report_files
     
     def _prepare_report_data(self, website, technical_results, ranked_pages, onpage_results):
         """
@@ -84,33 +288,34 @@ class ReportGenerator:
         # 현재 날짜
         now = datetime.now().strftime('%Y년 %m월 %d일')
         
-        # 전체 점수 계산
-        technical_score = self._calculate_technical_score(technical_results)
-        onpage_score = sum(result['score'] for result in onpage_results) / len(onpage_results) if onpage_results else 0
-        overall_score = (technical_score + onpage_score) / 2
-        
-        # 주요 이슈 및 권장사항 수집
+        # 주요 이슈 및 권장사항 수집 (접두어는 카테고리/페이지마다 한 번만 만들고 (접두어, 본문) 튜플로 보관,
+        # 튜플은 임시 리스트 없이 zip/repeat로 C 수준에서 생성해 바로 추가)
         all_issues = []
         all_recommendations = []
         
         # 기술적 SEO 이슈 및 권장사항
         for category, analysis in technical_results.items():
             if isinstance(analysis, dict) and 'issues' in analysis and 'recommendations' in analysis:
-                all_issues.extend([f"[기술적 SEO - {category}] {issue}" for issue in analysis['issues']])
-                all_recommendations.extend([f"[기술적 SEO - {category}] {rec}" for rec in analysis['recommendations']])
+                prefix = f"[기술적 SEO - {category}] "
+                all_issues.extend(zip(repeat(prefix), analysis['issues']))
+                all_recommendations.extend(zip(repeat(prefix), analysis['recommendations']))
                 
-        # 온페이지 SEO 이슈 및 권장사항
+        # 온페이지 SEO 점수 합계, 이슈 및 권장사항 (한 번의 순회로 함께 수집)
+        onpage_score_total = 0
         for result in onpage_results:
-            all_issues.extend([f"[온페이지 SEO - {result['url']}] {issue}" for issue in result['issues']])
-            all_recommendations.extend([f"[온페이지 SEO - {result['url']}] {rec}" for rec in result['recommendations']])
+            onpage_score_total += result['score']
+            prefix = f"[온페이지 SEO - {result['url']}] "
+            all_issues.extend(zip(repeat(prefix), result['issues']))
+            all_recommendations.extend(zip(repeat(prefix), result['recommendations']))
             
-        # 중요도에 따라 이슈 및 권장사항 정렬 (여기서는 간단히 길이로 정렬)
-        all_issues.sort(key=len, reverse=True)
-        all_recommendations.sort(key=len, reverse=True)
+        # 전체 점수 계산
+        technical_score = self._calculate_technical_score(technical_results)
+        onpage_score = onpage_score_total / len(onpage_results) if onpage_results else 0
+        overall_score = (technical_score + onpage_score) / 2
         
-        # 상위 10개 이슈 및 권장사항 선택
-        top_issues = all_issues[:10]
-        top_recommendations = all_recommendations[:10]
+        # 중요도(여기서는 간단히 결합된 문자열 길이) 기준 상위 10개만 부분 선택한 뒤 문자열로 결합
+        top_issues = [prefix + issue for prefix, issue in heapq.nlargest(10, all_issues, key=_joined_length)]
+        top_recommendations = [prefix + rec for prefix, rec in heapq.nlargest(10, all_recommendations, key=_joined_length)]
         
         # 키워드 분석
         keywords_data = self._analyze_keywords(website.id)
@@ -119,7 +324,7 @@ class ReportGenerator:
         report_data = {
             'website': {
                 'url': website.url,
-                'domain': website.url.split('://')[-1].split('/')[0]
+                'domain': urlsplit(website.url).netloc or website.url.partition('/')[0]
             },
             'date': now,
             'scores': {
@@ -149,133 +354,15 @@ class ReportGenerator:
         Returns:
             float: 기술적 SEO 점수
         """
-        # 각 카테고리별 가중치 설정
-        weights = {
-            'robots_txt': 0.05,
-            'sitemap': 0.05,
-            'site_structure': 0.1,
-            'core_web_vitals': 0.2,
-            'redirects': 0.05,
-            'canonical': 0.05,
-            'meta_tags': 0.15,
-            'structured_data': 0.1,
-            'links': 0.1,
-            'mobile_friendly': 0.1,
-            'security': 0.05,
-            'page_speed': 0.1
-        }
-        
-        # 각 카테고리별 점수 계산
-        scores = {}
-        
-        # robots.txt
-        if 'robots_txt' in technical_results:
-            if technical_results['robots_txt']['exists']:
-                scores['robots_txt'] = 100 - (len(technical_results['robots_txt']['issues']) * 20)
-            else:
-                scores['robots_txt'] = 0
-                
-        # sitemap
-        if 'sitemap' in technical_results:
-            if technical_results['sitemap']['exists']:
-                scores['sitemap'] = 100 - (len(technical_results['sitemap']['issues']) * 20)
-            else:
-                scores['sitemap'] = 0
-                
-        # site_structure
-        if 'site_structure' in technical_results:
-            scores['site_structure'] = 100 - (len(technical_results['site_structure']['issues']) * 20)
-            
-        # core_web_vitals
-        if 'core_web_vitals' in technical_results:
-            cwv = technical_results['core_web_vitals']
-            cwv_score = 0
-            
-            if 'LCP' in cwv and 'rating' in cwv['LCP']:
-                if cwv['LCP']['rating'] == 'good':
-                    cwv_score += 33
-                elif cwv['LCP']['rating'] == 'needs improvement':
-                    cwv_score += 16
-                    
-            if 'FID' in cwv and 'rating' in cwv['FID']:
-                if cwv['FID']['rating'] == 'good':
-                    cwv_score += 33
-                elif cwv['FID']['rating'] == 'needs improvement':
-                    cwv_score += 16
-                    
-            if 'CLS' in cwv and 'rating' in cwv['CLS']:
-                if cwv['CLS']['rating'] == 'good':
-                    cwv_score += 34
-                elif cwv['CLS']['rating'] == 'needs improvement':
-                    cwv_score += 17
-                    
-            scores['core_web_vitals'] = cwv_score
-            
-        # redirects
-        if 'redirects' in technical_results:
-            scores['redirects'] = 100 - (len(technical_results['redirects']['issues']) * 20)
-            
-        # canonical
-        if 'canonical' in technical_results:
-            canonical = technical_results['canonical']
-            if 'pages_with_canonical' in canonical and 'total_pages' in canonical and canonical['total_pages'] > 0:
-                scores['canonical'] = (canonical['pages_with_canonical'] / canonical['total_pages']) * 100
-            else:
-                scores['canonical'] = 0
-                
-        # meta_tags
-        if 'meta_tags' in technical_results:
-            meta_tags = technical_results['meta_tags']
-            if 'pages_with_issues' in meta_tags and 'total_pages' in meta_tags and meta_tags['total_pages'] > 0:
-                scores['meta_tags'] = 100 - ((meta_tags['pages_with_issues'] / meta_tags['total_pages']) * 100)
-            else:
-                scores['meta_tags'] = 0
-                
-        # structured_data
-        if 'structured_data' in technical_results:
-            structured_data = technical_results['structured_data']
-            if 'pages_with_schema' in structured_data and 'total_pages' in structured_data and structured_data['total_pages'] > 0:
-                scores['structured_data'] = (structured_data['pages_with_schema'] / structured_data['total_pages']) * 100
-            else:
-                scores['structured_data'] = 0
-                
-        # links
-        if 'links' in technical_results:
-            scores['links'] = 100 - (len(technical_results['links']['issues']) * 20)
-            
-        # mobile_friendly
-        if 'mobile_friendly' in technical_results:
-            if technical_results['mobile_friendly']['is_mobile_friendly']:
-                scores['mobile_friendly'] = 100
-            else:
-                scores['mobile_friendly'] = 0
-                
-        # security
-        if 'security' in technical_results:
-            security = technical_results['security']
-            security_score = 0
-            
-            if security['is_https']:
-                security_score += 50
-                
-            if security['has_hsts']:
-                security_score += 50
-                
-            scores['security'] = security_score
-            
-        # page_speed
-        if 'page_speed' in technical_results:
-            page_speed = technical_results['page_speed']
-            scores['page_speed'] = (page_speed['mobile_score'] + page_speed['desktop_score']) / 2
-            
-        # 가중 평균 계산
+        # 카테고리 순서대로 한 번만 순회하며 가중 평균 계산
         weighted_score = 0
         total_weight = 0
         
-        for category, score in scores.items():
-            if category in weights:
-                weighted_score += score * weights[category]
-                total_weight += weights[category]
+        for category, weight, scorer in _TECHNICAL_SCORERS:
+            result = technical_results.get(category)
+            if result is not None:
+                weighted_score += scorer(result) * weight
+                total_weight += weight
                 
         if total_weight > 0:
             return weighted_score / total_weight
@@ -293,7 +380,12 @@ class ReportGenerator:
             dict: 키워드 분석 결과
         """
         # 모든 페이지의 키워드 가져오기
-        all_keywords = db.session.query(Keyword.keyword, db.func.sum(Keyword.count).label('total_count')) \
+        # (총 단어 수는 그룹 합계에 대한 윈도 함수로 같은 쿼리의 모든 행에 함께 조회)
+        all_keywords = db.session.query(
+                            Keyword.keyword,
+                            db.func.sum(Keyword.count).label('total_count'),
+                            db.func.sum(db.func.sum(Keyword.count)).over().label('total_words')
+                        ) \
                         .join(Page) \
                         .filter(Page.website_id == website_id) \
                         .group_by(Keyword.keyword) \
@@ -301,27 +393,38 @@ class ReportGenerator:
                         .limit(50) \
                         .all()
                         
-        # 총 단어 수 계산
-        total_words = db.session.query(db.func.sum(Keyword.count)).join(Page).filter(Page.website_id == website_id).scalar() or 0
+        # 총 단어 수 (키워드가 없으면 0)
+        total_words = (all_keywords[0].total_words or 0) if all_keywords else 0
         
-        # 글로벌 키워드 밀도 계산
-        global_keywords = []
-        for keyword, count in all_keywords:
-            density = (count / total_words) * 100 if total_words > 0 else 0
-            global_keywords.append({
-                'keyword': keyword,
-                'count': count,
-                'density': round(density, 2)
-            })
-            
-        # 페이지별 주요 키워드
-        page_keywords = {}
-        pages = Page.query.filter_by(website_id=website_id).all()
+        # 글로벌 키워드 밀도 계산 (NumPy로 한 번에 벡터 연산)
+        counts = np.fromiter((row.total_count for row in all_keywords), dtype=np.int64, count=len(all_keywords))
+        if total_words > 0:
+            densities = np.round(counts / total_words * 100, 2)
+        else:
+            densities = np.zeros(len(counts))
+        global_keywords = [
+            {'keyword': keyword, 'count': int(count), 'density': float(density)}
+            for (keyword, _, _), count, density in zip(all_keywords, counts, densities)
+        ]
+            
+        # 페이지별 주요 키워드 (페이지마다 쿼리하지 않고 윈도 함수로 상위 5개를 한 번에 조회)
+        rn = db.func.row_number().over(
+            partition_by=Keyword.page_id,
+            order_by=(Keyword.count.desc(), Keyword.id)
+        ).label('rn')
+        # 순위는 이 웹사이트의 키워드에만 매기도록 서브쿼리 안에서 웹사이트로 한정
+        ranked = db.session.query(Keyword.page_id, Page.url, Keyword.keyword, Keyword.count, Keyword.density, rn) \
+                .join(Page, Keyword.page_id == Page.id) \
+                .filter(Page.website_id == website_id) \
+                .subquery()
+        rows = db.session.query(ranked.c.url, ranked.c.keyword, ranked.c.count, ranked.c.density) \
+                .filter(ranked.c.rn <= 5) \
+                .order_by(ranked.c.page_id, ranked.c.rn) \
+                .all()
         
-        for page in pages:
-            keywords = Keyword.query.filter_by(page_id=page.id).order_by(Keyword.count.desc()).limit(5).all()
-            if keywords:
-                page_keywords[page.url] = [{'keyword': kw.keyword, 'count': kw.count, 'density': kw.density} for kw in keywords]
+        page_keywords = {}
+        for url, keyword, count, density in rows:
+            page_keywords.setdefault(url, []).append({'keyword': keyword, 'count': count, 'density': density})
                 
         return {
             'global_keywords': global_keywords[:20],  # 상위 20개 키워드
@@ -334,620 +437,52 @@ class ReportGenerator:
         
         Args:
             report_data (dict): 보고서 데이터
-            output_file (str): 출력 파일 경로
+            output_file (Path): 출력 파일 경로
             
         Returns:
             str: 생성된 파일 경로
         """
-        with open(output_file, 'w', encoding='utf-8') as f:
-            # 제목 및 개요
-            f.write(f"# {report_data['website']['domain']} SEO 감사 보고서\n\n")
-            f.write(f"**분석 날짜:** {report_data['date']}\n\n")
-            f.write(f"**웹사이트:** {report_data['website']['url']}\n\n")
-            
-            # 종합 점수
-            f.write("## 종합 SEO 점수\n\n")
-            f.write(f"**전체 점수:** {report_data['scores']['overall']}/100\n\n")
-            f.write(f"**기술적 SEO 점수:** {report_data['scores']['technical']}/100\n\n")
-            f.write(f"**온페이지 SEO 점수:** {report_data['scores']['onpage']}/100\n\n")
-            
-            # 주요 이슈 및 권장사항
-            f.write("## 주요 이슈 및 개선 권장사항\n\n")
-            
-            f.write("### 주요 이슈\n\n")
-            for issue in report_data['summary']['top_issues']:
-                f.write(f"- {issue}\n")
-            f.write("\n")
-            
-            f.write("### 개선 권장사항\n\n")
-            for recommendation in report_data['summary']['top_recommendations']:
-                f.write(f"- {recommendation}\n")
-            f.write("\n")
-            
-            # 기술적 SEO 분석
-            f.write("## 기술적 SEO 분석\n\n")
-            
-            # robots.txt
-            if 'robots_txt' in report_data['technical_seo']:
-                robots = report_data['technical_seo']['robots_txt']
-                f.write("### robots.txt 분석\n\n")
-                f.write(f"**상태:** {'존재함' if robots['exists'] else '존재하지 않음'}\n\n")
-                if robots['exists']:
-                    f.write(f"**URL:** {robots['url']}\n\n")
-                    f.write("**내용:**\n\n")
-                    f.write("```\n")
-                    f.write(robots['content'][:500] + ('...' if len(robots['content']) > 500 else ''))
-                    f.write("\n```\n\n")
-                
-                if robots['issues']:
-                    f.write("**이슈:**\n\n")
-                    for issue in robots['issues']:
-                        f.write(f"- {issue}\n")
-                    f.write("\n")
-                
-                if robots['recommendations']:
-                    f.write("**권장사항:**\n\n")
-                    for rec in robots['recommendations']:
-                        f.write(f"- {rec}\n")
-                    f.write("\n")
-            
-            # sitemap.xml
-            if 'sitemap' in report_data['technical_seo']:
-                sitemap = report_data['technical_seo']['sitemap']
-                f.write("### sitemap.xml 분석\n\n")
-                f.write(f"**상태:** {'존재함' if sitemap['exists'] else '존재하지 않음'}\n\n")
-                if sitemap['exists']:
-                    f.write(f"**URL:** {sitemap['url']}\n\n")
-                    f.write(f"**URL 수:** {sitemap['urls_count']}\n\n")
-                
-                if sitemap['issues']:
-                    f.write("**이슈:**\n\n")
-                    for issue in sitemap['issues']:
-                        f.write(f"- {issue}\n")
-                    f.write("\n")
-                
-                if sitemap['recommendations']:
-                    f.write("**권장사항:**\n\n")
-                    for rec in sitemap['recommendations']:
-                        f.write(f"- {rec}\n")
-                    f.write("\n")
-            
-            # 사이트 구조
-            if 'site_structure' in report_data['technical_seo']:
-                structure = report_data['technical_seo']['site_structure']
-                f.write("### 사이트 구조 분석\n\n")
-                f.write(f"**총 페이지 수:** {structure['total_pages']}\n\n")
-                f.write(f"**최대 깊이:** {structure['max_depth']}\n\n")
-                
-                f.write("**깊이별 페이지 분포:**\n\n")
-                for depth, count in structure['depth_distribution'].items():
-                    f.write(f"- 깊이 {depth}: {count}개 페이지\n")
-                f.write("\n")
-                
-                if structure['issues']:
-                    f.write("**이슈:**\n\n")
-                    for issue in structure['issues']:
-                        f.write(f"- {issue}\n")
-                    f.write("\n")
-                
-                if structure['recommendations']:
-                    f.write("**권장사항:**\n\n")
-                    for rec in structure['recommendations']:
-                        f.write(f"- {rec}\n")
-                    f.write("\n")
-            
-            # Core Web Vitals
-            if 'core_web_vitals' in report_data['technical_seo']:
-                cwv = report_data['technical_seo']['core_web_vitals']
-                f.write("### Core Web Vitals 분석\n\n")
-                
-                if 'LCP' in cwv:
-                    lcp = cwv['LCP']
-                    f.write(f"**LCP (Largest Contentful Paint):** {lcp['value']}초 ({lcp['rating']})\n\n")
-                    f.write(f"- 좋음: {lcp['threshold']['good']}초 이하\n")
-                    f.write(f"- 개선 필요: {lcp['threshold']['good']}초 ~ {lcp['threshold']['poor']}초\n")
-                    f.write(f"- 나쁨: {lcp['threshold']['poor']}초 이상\n\n")
-                
-                if 'FID' in cwv:
-                    fid = cwv['FID']
-                    f.write(f"**FID (First Input Delay):** {fid['value']}ms ({fid['rating']})\n\n")
-                    f.write(f"- 좋음: {fid['threshold']['good']}ms 이하\n")
-                    f.write(f"- 개선 필요: {fid['threshold']['good']}ms ~ {fid['threshold']['poor']}ms\n")
-                    f.write(f"- 나쁨: {fid['threshold']['poor']}ms 이상\n\n")
-                
-                if 'CLS' in cwv:
-                    cls = cwv['CLS']
-                    f.write(f"**CLS (Cumulative Layout Shift):** {cls['value']} ({cls['rating']})\n\n")
-                    f.write(f"- 좋음: {cls['threshold']['good']} 이하\n")
-                    f.write(f"- 개선 필요: {cls['threshold']['good']} ~ {cls['threshold']['poor']}\n")
-                    f.write(f"- 나쁨: {cls['threshold']['poor']} 이상\n\n")
-                
-                if 'issues' in cwv and cwv['issues']:
-                    f.write("**이슈:**\n\n")
-                    for issue in cwv['issues']:
-                        f.write(f"- {issue}\n")
-                    f.write("\n")
-                
-                if 'recommendations' in cwv and cwv['recommendations']:
-                    f.write("**권장사항:**\n\n")
-                    for rec in cwv['recommendations']:
-                        f.write(f"- {rec}\n")
-                    f.write("\n")
-            
-            # 키워드 분석
-            f.write("## 키워드 분석\n\n")
-            
-            f.write("### 상위 키워드\n\n")
-            f.write("| 키워드 | 출현 횟수 | 밀도(%) |\n")
-            f.write("|--------|-----------|--------|\n")
-            for kw in report_data['keywords']['global_keywords'][:10]:
-                f.write(f"| {kw['keyword']} | {kw['count']} | {kw['density']} |\n")
-            f.write("\n")
-            
-            # 상위 페이지 분석
-            f.write("## 상위 페이지 분석\n\n")
-            
-            f.write("### 중요도 기준 상위 10개 페이지\n\n")
-            f.write("| 순위 | URL | 점수 | 깊이 | 내부 링크 수 |\n")
-            f.write("|------|-----|------|------|-------------|\n")
-            for i, page in enumerate(report_data['ranked_pages'][:10]):
-                f.write(f"| {i+1} | {page['url']} | {page['score']} | {page['depth']} | {page['inbound_links']} |\n")
-            f.write("\n")
-            
-            # 온페이지 SEO 분석
-            f.write("## 온페이지 SEO 분석\n\n")
-            
-            for i, page in enumerate(report_data['onpage_seo'][:5]):  # 상위 5개 페이지만 상세 분석
-                f.write(f"### {i+1}. {page['url']}\n\n")
-                f.write(f"**점수:** {page['score']}/100\n\n")
-                f.write(f"**제목:** {page['title']}\n\n")
-                f.write(f"**메타 설명:** {page['meta_description']}\n\n")
-                
-                f.write("**주요 키워드:**\n\n")
-                for kw in page['keywords'][:5]:
-                    f.write(f"- {kw['keyword']} (밀도: {kw['density']}%)\n")
-                f.write("\n")
-                
-                f.write("**주요 이슈:**\n\n")
-                for issue in page['issues'][:5]:
-                    f.write(f"- {issue}\n")
-                f.write("\n")
-                
-                f.write("**개선 권장사항:**\n\n")
-                for rec in page['recommendations'][:5]:
-                    f.write(f"- {rec}\n")
-                f.write("\n")
-            
-            # 결론 및 다음 단계
-            f.write("## 결론 및 다음 단계\n\n")
-            
-            f.write("이 SEO 감사 보고서는 웹사이트의 현재 SEO 상태에 대한 종합적인 분석을 제공합니다. ")
-            f.write("위에서 언급한 이슈를 해결하고 권장사항을 구현함으로써 검색 엔진 순위와 가시성을 크게 향상시킬 수 있습니다.\n\n")
-            
-            f.write("### 우선순위가 높은 작업\n\n")
-            
-            # 우선순위가 높은 권장사항 선택 (여기서는 처음 3개)
-            for i, rec in enumerate(report_data['summary']['top_recommendations'][:3]):
-                f.write(f"{i+1}. {rec}\n")
-            f.write("\n")
-            
-            f.write("### 중기 작업\n\n")
-            
-            # 중기 권장사항 선택 (여기서는 다음 3개)
-            for i, rec in enumerate(report_data['summary']['top_recommendations'][3:6]):
-                f.write(f"{i+1}. {rec}\n")
-            f.write("\n")
-            
-            f.write("### 장기 작업\n\n")
-            
-            # 장기 권장사항 선택 (여기서는 나머지)
-            for i, rec in enumerate(report_data['summary']['top_recommendations'][6:9]):
-                f.write(f"{i+1}. {rec}\n")
-            f.write("\n")
-            
-            # 용어 설명
-            f.write("## 용어 설명\n\n")
-            
-            f.write("- **SEO (Search Engine Optimization, 검색 엔진 최적화)**: 웹사이트가 검색 엔진 결과 페이지에서 더 높은 순위를 차지하도록 최적화하는 과정입니다.\n")
-            f.write("- **Core Web Vitals**: 사용자 경험을 측정하는 Google의 지표로, LCP, FID, CLS로 구성됩니다.\n")
-            f.write("- **LCP (Largest Contentful Paint, 최대 콘텐츠풀 페인트)**: 페이지 로드 시 가장 큰 콘텐츠 요소가 표시되는 시간을 측정합니다.\n")
-            f.write("- **FID (First Input Delay, 최초 입력 지연)**: 사용자가 페이지와 처음 상호 작용할 때 브라우저가 응답하는 데 걸리는 시간을 측정합니다.\n")
-            f.write("- **CLS (Cumulative Layout Shift, 누적 레이아웃 이동)**: 페이지 로드 중 예기치 않은 레이아웃 이동의 양을 측정합니다.\n")
-            f.write("- **robots.txt**: 검색 엔진 크롤러에게 웹사이트의 어떤 부분을 크롤링해야 하는지 알려주는 파일입니다.\n")
-            f.write("- **sitemap.xml**: 웹사이트의 모든 페이지 목록을 제공하여 검색 엔진이 콘텐츠를 더 효율적으로 크롤링할 수 있도록 돕는 파일입니다.\n")
-            f.write("- **canonical 태그**: 중복 콘텐츠가 있는 경우 검색 엔진에 원본 URL을 알려주는 HTML 태그입니다.\n")
-            f.write("- **키워드 밀도**: 전체 콘텐츠 대비 특정 키워드의 출현 빈도를 백분율로 나타낸 것입니다.\n")
-            f.write("- **메타 설명**: 검색 결과에 표시되는 페이지에 대한 간략한 설명을 제공하는 HTML 태그입니다.\n")
-            
-        return output_file
+        # 미리 컴파일된 템플릿에 데이터만 채워 한 번에 기록
+        rendered = _MARKDOWN_TEMPLATE.render(
+            data=report_data,
+            technical_seo=report_data['technical_seo'],
+            scores=report_data['scores'],
+            summary=report_data['summary'],
+            keywords=report_data['keywords']
+        )
+        output_file.write_bytes(rendered.encode('utf-8'))
+            
+        return str(output_file)
     
-    def _generate_html_report(self, report_data, output_file):
+    def _generate_html_report(self, report_data, output_file, compress=False):
         """
         HTML 형식으로 보고서 생성
         
         Args:
             report_data (dict): 보고서 데이터
-            output_file (str): 출력 파일 경로
+            output_file (Path): 출력 파일 경로
+            compress (bool): 같은 내용을 output_file + '.gz'로도 압축 저장할지 여부
             
         Returns:
             str: 생성된 파일 경로
         """
-        with open(output_file, 'w', encoding='utf-8') as f:
-            # HTML 헤더
-            f.write("""<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>SEO 감사 보고서</title>
-    <style>
-        body {
-            font-family: 'Noto Sans KR', Arial, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-        }
-        h1, h2, h3, h4 {
-            color: #2c3e50;
-        }
-        h1 {
-            border-bottom: 2px solid #3498db;
-            padding-bottom: 10px;
-        }
-        h2 {
-            border-bottom: 1px solid #ddd;
-            padding-bottom: 5px;
-            margin-top: 30px;
-        }
-        table {
-            border-collapse: collapse;
-            width: 100%;
-            margin: 20px 0;
-        }
-        th, td {
-            border: 1px solid #ddd;
-            padding: 8px;
-            text-align: left;
-        }
-        th {
-            background-color: #f2f2f2;
-        }
-        tr:nth-child(even) {
-            background-color: #f9f9f9;
-        }
-        .score-container {
-            display: flex;
-            justify-content: space-between;
-            margin: 20px 0;
-        }
-        .score-box {
-            flex: 1;
-            margin: 0 10px;
-            padding: 20px;
-            border-radius: 5px;
-            text-align: center;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }
-        .overall-score {
-            background-color: #3498db;
-            color: white;
-        }
-        .technical-score {
-            background-color: #2ecc71;
-            color: white;
-        }
-        .onpage-score {
-            background-color: #e74c3c;
-            color: white;
-        }
-        .score-value {
-            font-size: 2em;
-            font-weight: bold;
-        }
-        .issues, .recommendations {
-            background-color: #f9f9f9;
-            padding: 15px;
-            border-radius: 5px;
-            margin: 10px 0;
-        }
-        .issues li, .recommendations li {
-            margin-bottom: 10px;
-        }
-        pre {
-            background-color: #f5f5f5;
-            padding: 10px;
-            border-radius: 5px;
-            overflow-x: auto;
-        }
-        .glossary-term {
-            font-weight: bold;
-        }
-        .glossary-definition {
-            margin-left: 20px;
-            margin-bottom: 10px;
-        }
-        @media print {
-            body {
-                font-size: 12pt;
-            }
-            .score-box {
-                break-inside: avoid;
-            }
-            h2, h3 {
-                break-after: avoid;
-            }
-            table {
-                break-inside: auto;
-            }
-            tr {
-                break-inside: avoid;
-                break-after: auto;
-            }
-        }
-    </style>
-</head>
-<body>
-""")
-            
-            # 제목 및 개요
-            f.write(f"<h1>{report_data['website']['domain']} SEO 감사 보고서</h1>\n")
-            f.write(f"<p><strong>분석 날짜:</strong> {report_data['date']}</p>\n")
-            f.write(f"<p><strong>웹사이트:</strong> {report_data['website']['url']}</p>\n")
-            
-            # 종합 점수
-            f.write("<h2>종합 SEO 점수</h2>\n")
-            f.write("<div class='score-container'>\n")
-            f.write(f"<div class='score-box overall-score'><h3>전체 점수</h3><div class='score-value'>{report_data['scores']['overall']}</div><div>/ 100</div></div>\n")
-            f.write(f"<div class='score-box technical-score'><h3>기술적 SEO</h3><div class='score-value'>{report_data['scores']['technical']}</div><div>/ 100</div></div>\n")
-            f.write(f"<div class='score-box onpage-score'><h3>온페이지 SEO</h3><div class='score-value'>{report_data['scores']['onpage']}</div><div>/ 100</div></div>\n")
-            f.write("</div>\n")
-            
-            # 주요 이슈 및 권장사항
-            f.write("<h2>주요 이슈 및 개선 권장사항</h2>\n")
-            
-            f.write("<h3>주요 이슈</h3>\n")
-            f.write("<div class='issues'>\n<ul>\n")
-            for issue in report_data['summary']['top_issues']:
-                f.write(f"<li>{issue}</li>\n")
-            f.write("</ul>\n</div>\n")
-            
-            f.write("<h3>개선 권장사항</h3>\n")
-            f.write("<div class='recommendations'>\n<ul>\n")
-            for recommendation in report_data['summary']['top_recommendations']:
-                f.write(f"<li>{recommendation}</li>\n")
-            f.write("</ul>\n</div>\n")
-            
-            # 기술적 SEO 분석
-            f.write("<h2>기술적 SEO 분석</h2>\n")
-            
-            # robots.txt
-            if 'robots_txt' in report_data['technical_seo']:
-                robots = report_data['technical_seo']['robots_txt']
-                f.write("<h3>robots.txt 분석</h3>\n")
-                f.write(f"<p><strong>상태:</strong> {'존재함' if robots['exists'] else '존재하지 않음'}</p>\n")
-                if robots['exists']:
-                    f.write(f"<p><strong>URL:</strong> {robots['url']}</p>\n")
-                    f.write("<p><strong>내용:</strong></p>\n")
-                    f.write("<pre>\n")
-                    f.write(robots['content'][:500] + ('...' if len(robots['content']) > 500 else ''))
-                    f.write("\n</pre>\n")
-                
-                if robots['issues']:
-                    f.write("<p><strong>이슈:</strong></p>\n<ul>\n")
-                    for issue in robots['issues']:
-                        f.write(f"<li>{issue}</li>\n")
-                    f.write("</ul>\n")
-                
-                if robots['recommendations']:
-                    f.write("<p><strong>권장사항:</strong></p>\n<ul>\n")
-                    for rec in robots['recommendations']:
-                        f.write(f"<li>{rec}</li>\n")
-                    f.write("</ul>\n")
-            
-            # sitemap.xml
-            if 'sitemap' in report_data['technical_seo']:
-                sitemap = report_data['technical_seo']['sitemap']
-                f.write("<h3>sitemap.xml 분석</h3>\n")
-                f.write(f"<p><strong>상태:</strong> {'존재함' if sitemap['exists'] else '존재하지 않음'}</p>\n")
-                if sitemap['exists']:
-                    f.write(f"<p><strong>URL:</strong> {sitemap['url']}</p>\n")
-                    f.write(f"<p><strong>URL 수:</strong> {sitemap['urls_count']}</p>\n")
-                
-                if sitemap['issues']:
-                    f.write("<p><strong>이슈:</strong></p>\n<ul>\n")
-                    for issue in sitemap['issues']:
-                        f.write(f"<li>{issue}</li>\n")
-                    f.write("</ul>\n")
-                
-                if sitemap['recommendations']:
-                    f.write("<p><strong>권장사항:</strong></p>\n<ul>\n")
-                    for rec in sitemap['recommendations']:
-                        f.write(f"<li>{rec}</li>\n")
-                    f.write("</ul>\n")
-            
-            # 사이트 구조
-            if 'site_structure' in report_data['technical_seo']:
-                structure = report_data['technical_seo']['site_structure']
-                f.write("<h3>사이트 구조 분석</h3>\n")
-                f.write(f"<p><strong>총 페이지 수:</strong> {structure['total_pages']}</p>\n")
-                f.write(f"<p><strong>최대 깊이:</strong> {structure['max_depth']}</p>\n")
-                
-                f.write("<p><strong>깊이별 페이지 분포:</strong></p>\n<ul>\n")
-                for depth, count in structure['depth_distribution'].items():
-                    f.write(f"<li>깊이 {depth}: {count}개 페이지</li>\n")
-                f.write("</ul>\n")
-                
-                if structure['issues']:
-                    f.write("<p><strong>이슈:</strong></p>\n<ul>\n")
-                    for issue in structure['issues']:
-                        f.write(f"<li>{issue}</li>\n")
-                    f.write("</ul>\n")
-                
-                if structure['recommendations']:
-                    f.write("<p><strong>권장사항:</strong></p>\n<ul>\n")
-                    for rec in structure['recommendations']:
-                        f.write(f"<li>{rec}</li>\n")
-                    f.write("</ul>\n")
-            
-            # Core Web Vitals
-            if 'core_web_vitals' in report_data['technical_seo']:
-                cwv = report_data['technical_seo']['core_web_vitals']
-                f.write("<h3>Core Web Vitals 분석</h3>\n")
-                
-                if 'LCP' in cwv:
-                    lcp = cwv['LCP']
-                    f.write(f"<p><strong>LCP (Largest Contentful Paint):</strong> {lcp['value']}초 ({lcp['rating']})</p>\n")
-                    f.write("<ul>\n")
-                    f.write(f"<li>좋음: {lcp['threshold']['good']}초 이하</li>\n")
-                    f.write(f"<li>개선 필요: {lcp['threshold']['good']}초 ~ {lcp['threshold']['poor']}초</li>\n")
-                    f.write(f"<li>나쁨: {lcp['threshold']['poor']}초 이상</li>\n")
-                    f.write("</ul>\n")
-                
-                if 'FID' in cwv:
-                    fid = cwv['FID']
-                    f.write(f"<p><strong>FID (First Input Delay):</strong> {fid['value']}ms ({fid['rating']})</p>\n")
-                    f.write("<ul>\n")
-                    f.write(f"<li>좋음: {fid['threshold']['good']}ms 이하</li>\n")
-                    f.write(f"<li>개선 필요: {fid['threshold']['good']}ms ~ {fid['threshold']['poor']}ms</li>\n")
-                    f.write(f"<li>나쁨: {fid['threshold']['poor']}ms 이상</li>\n")
-                    f.write("</ul>\n")
-                
-                if 'CLS' in cwv:
-                    cls = cwv['CLS']
-                    f.write(f"<p><strong>CLS (Cumulative Layout Shift):</strong> {cls['value']} ({cls['rating']})</p>\n")
-                    f.write("<ul>\n")
-                    f.write(f"<li>좋음: {cls['threshold']['good']} 이하</li>\n")
-                    f.write(f"<li>개선 필요: {cls['threshold']['good']} ~ {cls['threshold']['poor']}</li>\n")
-                    f.write(f"<li>나쁨: {cls['threshold']['poor']} 이상</li>\n")
-                    f.write("</ul>\n")
-                
-                if 'issues' in cwv and cwv['issues']:
-                    f.write("<p><strong>이슈:</strong></p>\n<ul>\n")
-                    for issue in cwv['issues']:
-                        f.write(f"<li>{issue}</li>\n")
-                    f.write("</ul>\n")
-                
-                if 'recommendations' in cwv and cwv['recommendations']:
-                    f.write("<p><strong>권장사항:</strong></p>\n<ul>\n")
-                    for rec in cwv['recommendations']:
-                        f.write(f"<li>{rec}</li>\n")
-                    f.write("</ul>\n")
-            
-            # 키워드 분석
-            f.write("<h2>키워드 분석</h2>\n")
-            
-            f.write("<h3>상위 키워드</h3>\n")
-            f.write("<table>\n")
-            f.write("<tr><th>키워드</th><th>출현 횟수</th><th>밀도(%)</th></tr>\n")
-            for kw in report_data['keywords']['global_keywords'][:10]:
-                f.write(f"<tr><td>{kw['keyword']}</td><td>{kw['count']}</td><td>{kw['density']}</td></tr>\n")
-            f.write("</table>\n")
-            
-            # 상위 페이지 분석
-            f.write("<h2>상위 페이지 분석</h2>\n")
-            
-            f.write("<h3>중요도 기준 상위 10개 페이지</h3>\n")
-            f.write("<table>\n")
-            f.write("<tr><th>순위</th><th>URL</th><th>점수</th><th>깊이</th><th>내부 링크 수</th></tr>\n")
-            for i, page in enumerate(report_data['ranked_pages'][:10]):
-                f.write(f"<tr><td>{i+1}</td><td>{page['url']}</td><td>{page['score']}</td><td>{page['depth']}</td><td>{page['inbound_links']}</td></tr>\n")
-            f.write("</table>\n")
-            
-            # 온페이지 SEO 분석
-            f.write("<h2>온페이지 SEO 분석</h2>\n")
-            
-            for i, page in enumerate(report_data['onpage_seo'][:5]):  # 상위 5개 페이지만 상세 분석
-                f.write(f"<h3>{i+1}. {page['url']}</h3>\n")
-                f.write(f"<p><strong>점수:</strong> {page['score']}/100</p>\n")
-                f.write(f"<p><strong>제목:</strong> {page['title']}</p>\n")
-                f.write(f"<p><strong>메타 설명:</strong> {page['meta_description']}</p>\n")
-                
-                f.write("<p><strong>주요 키워드:</strong></p>\n<ul>\n")
-                for kw in page['keywords'][:5]:
-                    f.write(f"<li>{kw['keyword']} (밀도: {kw['density']}%)</li>\n")
-                f.write("</ul>\n")
-                
-                f.write("<p><strong>주요 이슈:</strong></p>\n<ul>\n")
-                for issue in page['issues'][:5]:
-                    f.write(f"<li>{issue}</li>\n")
-                f.write("</ul>\n")
-                
-                f.write("<p><strong>개선 권장사항:</strong></p>\n<ul>\n")
-                for rec in page['recommendations'][:5]:
-                    f.write(f"<li>{rec}</li>\n")
-                f.write("</ul>\n")
-            
-            # 결론 및 다음 단계
-            f.write("<h2>결론 및 다음 단계</h2>\n")
-            
-            f.write("<p>이 SEO 감사 보고서는 웹사이트의 현재 SEO 상태에 대한 종합적인 분석을 제공합니다. ")
-            f.write("위에서 언급한 이슈를 해결하고 권장사항을 구현함으로써 검색 엔진 순위와 가시성을 크게 향상시킬 수 있습니다.</p>\n")
-            
-            f.write("<h3>우선순위가 높은 작업</h3>\n<ol>\n")
-            
-            # 우선순위가 높은 권장사항 선택 (여기서는 처음 3개)
-            for rec in report_data['summary']['top_recommendations'][:3]:
-                f.write(f"<li>{rec}</li>\n")
-            f.write("</ol>\n")
-            
-            f.write("<h3>중기 작업</h3>\n<ol>\n")
-            
-            # 중기 권장사항 선택 (여기서는 다음 3개)
-            for rec in report_data['summary']['top_recommendations'][3:6]:
-                f.write(f"<li>{rec}</li>\n")
-            f.write("</ol>\n")
-            
-            f.write("<h3>장기 작업</h3>\n<ol>\n")
-            
-            # 장기 권장사항 선택 (여기서는 나머지)
-            for rec in report_data['summary']['top_recommendations'][6:9]:
-                f.write(f"<li>{rec}</li>\n")
-            f.write("</ol>\n")
-            
-            # 용어 설명
-            f.write("<h2>용어 설명</h2>\n")
-            
-            f.write("<dl>\n")
-            f.write("<dt class='glossary-term'>SEO (Search Engine Optimization, 검색 엔진 최적화)</dt>\n")
-            f.write("<dd class='glossary-definition'>웹사이트가 검색 엔진 결과 페이지에서 더 높은 순위를 차지하도록 최적화하는 과정입니다.</dd>\n")
-            
-            f.write("<dt class='glossary-term'>Core Web Vitals</dt>\n")
-            f.write("<dd class='glossary-definition'>사용자 경험을 측정하는 Google의 지표로, LCP, FID, CLS로 구성됩니다.</dd>\n")
-            
-            f.write("<dt class='glossary-term'>LCP (Largest Contentful Paint, 최대 콘텐츠풀 페인트)</dt>\n")
-            f.write("<dd class='glossary-definition'>페이지 로드 시 가장 큰 콘텐츠 요소가 표시되는 시간을 측정합니다.</dd>\n")
-            
-            f.write("<dt class='glossary-term'>FID (First Input Delay, 최초 입력 지연)</dt>\n")
-            f.write("<dd class='glossary-definition'>사용자가 페이지와 처음 상호 작용할 때 브라우저가 응답하는 데 걸리는 시간을 측정합니다.</dd>\n")
-            
-            f.write("<dt class='glossary-term'>CLS (Cumulative Layout Shift, 누적 레이아웃 이동)</dt>\n")
-            f.write("<dd class='glossary-definition'>페이지 로드 중 예기치 않은 레이아웃 이동의 양을 측정합니다.</dd>\n")
-            
-            f.write("<dt class='glossary-term'>robots.txt</dt>\n")
-            f.write("<dd class='glossary-definition'>검색 엔진 크롤러에게 웹사이트의 어떤 부분을 크롤링해야 하는지 알려주는 파일입니다.</dd>\n")
-            
-            f.write("<dt class='glossary-term'>sitemap.xml</dt>\n")
-            f.write("<dd class='glossary-definition'>웹사이트의 모든 페이지 목록을 제공하여 검색 엔진이 콘텐츠를 더 효율적으로 크롤링할 수 있도록 돕는 파일입니다.</dd>\n")
-            
-            f.write("<dt class='glossary-term'>canonical 태그</dt>\n")
-            f.write("<dd class='glossary-definition'>중복 콘텐츠가 있는 경우 검색 엔진에 원본 URL을 알려주는 HTML 태그입니다.</dd>\n")
-            
-            f.write("<dt class='glossary-term'>키워드 밀도</dt>\n")
-            f.write("<dd class='glossary-definition'>전체 콘텐츠 대비 특정 키워드의 출현 빈도를 백분율로 나타낸 것입니다.</dd>\n")
-            
-            f.write("<dt class='glossary-term'>메타 설명</dt>\n")
-            f.write("<dd class='glossary-definition'>검색 결과에 표시되는 페이지에 대한 간략한 설명을 제공하는 HTML 태그입니다.</dd>\n")
-            f.write("</dl>\n")
-            
-            # HTML 푸터
-            f.write("""
-</body>
-</html>
-""")
-            
-        return output_file
+        # 미리 컴파일된 템플릿에 데이터만 채워 한 번에 기록
+        rendered = _HTML_TEMPLATE.render(
+            data=report_data,
+            technical_seo=report_data['technical_seo'],
+            scores=report_data['scores'],
+            summary=report_data['summary'],
+            keywords=report_data['keywords']
+        )
+        html_bytes = b''.join((_HTML_HEAD, rendered.encode('utf-8'), _HTML_FOOT))
+        output_file.write_bytes(html_bytes)
+            
+        # 전송 및 보관용 압축본 (인코딩된 버퍼를 그대로 한 번에 압축 기록)
+        if compress:
+            with gzip.open(f"{output_file}.gz", 'wb', compresslevel=6) as f:
+                f.write(html_bytes)
+            
+        return str(output_file)
     
     def _prepare_presentation_data(self, report_data):
         """
@@ -959,16 +494,30 @@ class ReportGenerator:
         Returns:
             dict: 프레젠테이션 데이터
         """
+        # 보고서 데이터의 하위 객체를 복사하지 않고 그대로 참조해 구성
+        # (두 JSON 파일 모두 같은 파이썬 객체를 직렬화하며 재인코딩 과정 없음)
+        website = report_data['website']
+        technical_seo = report_data['technical_seo']
+        top_recommendations = report_data['summary']['top_recommendations']
+        
+        # 기술적 SEO 카테고리 상태 요약에 쓰는 하위 결과 (없거나 None이면 빈 dict)
+        robots = technical_seo.get('robots_txt') or {}
+        sitemap = technical_seo.get('sitemap') or {}
+        structure = technical_seo.get('site_structure') or {}
+        cwv = technical_seo.get('core_web_vitals') or {}
+        mobile = technical_seo.get('mobile_friendly') or {}
+        security = technical_seo.get('security') or {}
+        
         presentation_data = {
-            'title': f"{report_data['website']['domain']} SEO 감사 보고서",
+            'title': f"{website['domain']} SEO 감사 보고서",
             'date': report_data['date'],
-            'website': report_data['website']['url'],
+            'website': website['url'],
             'scores': report_data['scores'],
             'slides': [
                 {
                     'title': '개요',
                     'content': {
-                        'text': f"이 보고서는 {report_data['website']['url']}의 SEO 상태에 대한 종합적인 분석을 제공합니다.",
+                        'text': f"이 보고서는 {website['url']}의 SEO 상태에 대한 종합적인 분석을 제공합니다.",
                         'points': [
                             "검색 엔진 최적화(SEO)는 웹사이트의 가시성과 검색 엔진 순위를 향상시키는 과정입니다.",
                             "이 감사는 기술적 SEO, 온페이지 SEO, 키워드 분석을 포함합니다.",
@@ -979,11 +528,7 @@ class ReportGenerator:
                 {
                     'title': 'SEO 점수',
                     'content': {
-                        'scores': {
-                            'overall': report_data['scores']['overall'],
-                            'technical': report_data['scores']['technical'],
-                            'onpage': report_data['scores']['onpage']
-                        }
+                        'scores': report_data['scores']
                     }
                 },
                 {
@@ -995,7 +540,7 @@ class ReportGenerator:
                 {
                     'title': '개선 권장사항',
                     'content': {
-                        'recommendations': report_data['summary']['top_recommendations'][:5]
+                        'recommendations': top_recommendations[:5]
                     }
                 },
                 {
@@ -1003,12 +548,12 @@ class ReportGenerator:
                     'content': {
                         'text': "기술적 SEO는 검색 엔진이 웹사이트를 크롤링하고 색인화하는 방식에 영향을 미치는 요소입니다.",
                         'categories': [
-                            {'name': 'robots.txt', 'status': '존재함' if report_data['technical_seo'].get('robots_txt', {}).get('exists', False) else '존재하지 않음'},
-                            {'name': 'sitemap.xml', 'status': '존재함' if report_data['technical_seo'].get('sitemap', {}).get('exists', False) else '존재하지 않음'},
-                            {'name': '사이트 구조', 'status': f"최대 깊이: {report_data['technical_seo'].get('site_structure', {}).get('max_depth', 'N/A')}"},
-                            {'name': 'Core Web Vitals', 'status': report_data['technical_seo'].get('core_web_vitals', {}).get('LCP', {}).get('rating', 'N/A')},
-                            {'name': '모바일 친화성', 'status': '좋음' if report_data['technical_seo'].get('mobile_friendly', {}).get('is_mobile_friendly', False) else '개선 필요'},
-                            {'name': 'HTTPS', 'status': '사용 중' if report_data['technical_seo'].get('security', {}).get('is_https', False) else '사용하지 않음'}
+                            {'name': 'robots.txt', 'status': '존재함' if robots.get('exists', False) else '존재하지 않음'},
+                            {'name': 'sitemap.xml', 'status': '존재함' if sitemap.get('exists', False) else '존재하지 않음'},
+                            {'name': '사이트 구조', 'status': f"최대 깊이: {structure.get('max_depth', 'N/A')}"},
+                            {'name': 'Core Web Vitals', 'status': cwv.get('LCP', {}).get('rating', 'N/A')},
+                            {'name': '모바일 친화성', 'status': '좋음' if mobile.get('is_mobile_friendly', False) else '개선 필요'},
+                            {'name': 'HTTPS', 'status': '사용 중' if security.get('is_https', False) else '사용하지 않음'}
                         ]
                     }
                 },
@@ -1044,9 +589,9 @@ class ReportGenerator:
                     'content': {
                         'text': "다음은 SEO를 개선하기 위한 권장 단계입니다.",
                         'steps': {
-                            'high': report_data['summary']['top_recommendations'][:3],
-                            'medium': report_data['summary']['top_recommendations'][3:6],
-                            'low': report_data['summary']['top_recommendations'][6:9]
+                            'high': top_recommendations[:3],
+                            'medium': top_recommendations[3:6],
+                            'low': top_recommendations[6:9]
                         }
                     }
                 },
@@ -8,7 +8,7 @@ import functools
 import logging
 import traceback
 import time
-import requests
+from collections import Counter
 from typing import Any, Callable, Optional, Dict, Union
 
 class AuditError(Exception):
@@ -32,7 +32,7 @@ class ErrorHandler:
     
     def __init__(self, logger_name='seo_audit_errors'):
         self.logger = self._setup_logger(logger_name)
-        self.error_counts = {}
+        self.error_counts = Counter()
         
     def _setup_logger(self, name):
         """Setup enhanced logging"""
@@ -40,8 +40,8 @@ class ErrorHandler:
         logger.setLevel(logging.INFO)
         
         if not logger.handlers:
-            # File handler for errors
-            file_handler = logging.FileHandler('seo_audit_errors.log')
+            # File handler for errors (opened lazily on the first ERROR record)
+            file_handler = logging.FileHandler('seo_audit_errors.log', delay=True)
             file_handler.setLevel(logging.ERROR)
             
             # Console handler for warnings and errors
@@ -74,39 +74,38 @@ class ErrorHandler:
             fallback: Fallback value to return if all retries fail
         """
         def decorator(func):
+            # Sleep schedule between attempts, computed once per decorated function
+            delays = tuple(
+                delay * (2 ** attempt) if exponential_backoff else delay
+                for attempt in range(max_retries)
+            )
+            
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
-                last_exception = None
-                current_delay = delay
-                
-                for attempt in range(max_retries + 1):
+                for attempt, current_delay in enumerate(delays):
                     try:
                         return func(*args, **kwargs)
                     except exceptions as e:
-                        last_exception = e
-                        
                         # Log the attempt
-                        if attempt < max_retries:
-                            self.logger.warning(
-                                f"Attempt {attempt + 1}/{max_retries + 1} failed for {func.__name__}: {str(e)}"
-                            )
-                            time.sleep(current_delay)
-                            
-                            if exponential_backoff:
-                                current_delay *= 2
-                        else:
-                            # Final attempt failed
-                            self.logger.error(
-                                f"All {max_retries + 1} attempts failed for {func.__name__}: {str(e)}"
-                            )
-                            self._record_error(func.__name__, e)
-                            
-                # Return fallback or raise final exception
-                if fallback is not None:
-                    self.logger.info(f"Using fallback value for {func.__name__}")
-                    return fallback
-                else:
-                    raise last_exception
+                        self.logger.warning(
+                            f"Attempt {attempt + 1}/{max_retries + 1} failed for {func.__name__}: {str(e)}"
+                        )
+                        time.sleep(current_delay)
+                        
+                # Final attempt, outside the retry loop
+                try:
+                    return func(*args, **kwargs)
+                except exceptions as e:
+                    self.logger.error(
+                        f"All {max_retries + 1} attempts failed for {func.__name__}: {str(e)}"
+                    )
+                    self._record_error(func.__name__, e)
+                    
+                    # Return fallback or raise final exception
+                    if fallback is not None:
+                        self.logger.info(f"Using fallback value for {func.__name__}")
+                        return fallback
+                    raise
                     
             return wrapper
         return decorator
@@ -127,7 +126,9 @@ class ErrorHandler:
             return func(*args, **kwargs)
         except Exception as e:
             self.logger.error(f"{error_message}: {str(e)}")
-            self.logger.debug(traceback.format_exc())
+            # Only format the traceback when DEBUG output is actually enabled
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(traceback.format_exc())
             self._record_error(func.__name__, e)
             
             if fallback is not None:
@@ -138,6 +139,9 @@ class ErrorHandler:
         """
         Decorator for handling network-related errors
         """
+        # Deferred so importing this module does not pull in requests/urllib3/ssl
+        import requests
+        
         def decorator(func):
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
@@ -217,45 +221,83 @@ class ErrorHandler:
         
     def _record_error(self, operation: str, error: Exception):
         """Record error statistics"""
-        error_type = type(error).__name__
-        key = f"{operation}:{error_type}"
-        
-        if key not in self.error_counts:
-            self.error_counts[key] = 0
-        self.error_counts[key] += 1
+        self.error_counts[f"{operation}:{type(error).__name__}"] += 1
         
     def get_error_summary(self) -> Dict[str, int]:
         """Get summary of all recorded errors"""
-        return self.error_counts.copy()
+        return dict(self.error_counts)
         
     def reset_error_counts(self):
         """Reset error counters"""
         self.error_counts.clear()
 
-# Global error handler instance
-error_handler = ErrorHandler()
+# Global error handler instance (created on first use, not at import time)
+_error_handler = None
+
+def get_error_handler() -> ErrorHandler:
+    """Get the shared error handler, creating it on first use"""
+    global _error_handler
+    if _error_handler is None:
+        _error_handler = ErrorHandler()
+    return _error_handler
+
+def __getattr__(name):
+    """Resolve the lazily created module-level `error_handler`"""
+    if name == 'error_handler':
+        return get_error_handler()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _lazy_decorator(make_decorator: Callable):
+    """Apply a shared-handler decorator on the first call instead of at decoration time"""
+    def decorator(func):
+        wrapped = None
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            nonlocal wrapped
+            if wrapped is None:
+                wrapped = make_decorator(get_error_handler())(func)
+            return wrapped(*args, **kwargs)
+        return wrapper
+    return decorator
 
 # Convenience decorators
 def retry_on_failure(max_retries=3, delay=1, exceptions=(Exception,)):
     """Simplified retry decorator"""
-    return error_handler.with_retry(max_retries, delay, True, exceptions)
+    return _lazy_decorator(lambda handler: handler.with_retry(max_retries, delay, True, exceptions))
+
+def _retry_on_request_errors(max_retries=3, delay=1):
+    """Retry on requests.RequestException, importing requests only when first called"""
+    def make_decorator(handler):
+        import requests
+        return handler.with_retry(max_retries, delay, True, (requests.RequestException,))
+    return _lazy_decorator(make_decorator)
 
 def handle_gracefully(operation_name: str, critical: bool = False):
     """Simplified graceful degradation decorator"""
-    return error_handler.graceful_degradation(operation_name, critical)
+    return _lazy_decorator(lambda handler: handler.graceful_degradation(operation_name, critical))
 
 def safe_network_request(url: str, timeout: int = 30):
     """Simplified network error handling decorator"""
-    return error_handler.handle_network_errors(url, timeout)
+    return _lazy_decorator(lambda handler: handler.handle_network_errors(url, timeout))
 
 def validate_input(required_fields: list = None, data_type: type = None, min_length: int = None):
     """Input validation decorator"""
     def decorator(func):
+        if required_fields is None and data_type is None and min_length is None:
+            # Nothing to validate beyond the None check, so skip the validate_data call
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if args and args[0] is None:
+                    raise ValueError("Data cannot be None")
+                return func(*args, **kwargs)
+            return wrapper
+            
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             # Validate first argument (usually the data)
             if args:
-                error_handler.validate_data(args[0], required_fields, data_type, min_length)
+                get_error_handler().validate_data(args[0], required_fields, data_type, min_length)
             return func(*args, **kwargs)
         return wrapper
     return decorator
@@ -266,7 +308,7 @@ class FieldTestingMixin:
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.error_handler = error_handler
+        self.error_handler = get_error_handler()
         
     @handle_gracefully("chart_generation", critical=False)
     def safe_generate_chart(self, chart_type: str, data: dict):
@@ -274,7 +316,7 @@ class FieldTestingMixin:
         # Implementation would go here
         pass
         
-    @retry_on_failure(max_retries=3, exceptions=(requests.RequestException,))
+    @_retry_on_request_errors(max_retries=3)
     @safe_network_request("", timeout=30)
     def robust_fetch_page(self, url: str):
         """Fetch page with retry and network error handling"""